@@ -0,0 +1,29 @@
+"""add partial index for the active campaign audit
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_campaigns_active",
+        "campaigns",
+        ["name"],
+        postgresql_where=sa.text("status = 'ACTIVE'"),
+        postgresql_include=["offsite_delivery_enabled", "audience_expansion_enabled", "cost_type"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_campaigns_active", table_name="campaigns")
@@ -0,0 +1,49 @@
+"""store fetched_at / started_at / finished_at as epoch seconds
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = [
+    ("ad_accounts", "fetched_at"),
+    ("campaigns", "fetched_at"),
+    ("creatives", "fetched_at"),
+    ("campaign_daily_metrics", "fetched_at"),
+    ("creative_daily_metrics", "fetched_at"),
+    ("audience_demographics", "fetched_at"),
+    ("sync_log", "started_at"),
+    ("sync_log", "finished_at"),
+]
+
+
+def upgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.BigInteger(),
+            postgresql_using=f"EXTRACT(EPOCH FROM {column}::timestamptz)::bigint",
+        )
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Text(),
+            postgresql_using=(
+                f"to_char(to_timestamp({column}) AT TIME ZONE 'UTC', "
+                "'YYYY-MM-DD\"T\"HH24:MI:SS\"+00:00\"')"
+            ),
+        )
@@ -0,0 +1,27 @@
+"""add composite index for the sync_log freshness gate
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_sync_log_freshness",
+        "sync_log",
+        ["account_id", "status", sa.text("finished_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sync_log_freshness", table_name="sync_log")
@@ -0,0 +1,23 @@
+"""add snapshot_hash column to sync_log
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("sync_log", sa.Column("snapshot_hash", sa.Text()))
+
+
+def downgrade() -> None:
+    op.drop_column("sync_log", "snapshot_hash")
@@ -30,6 +30,8 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = "app"
     POSTGRES_PASSWORD: str = "changeme"
     POSTGRES_DB: str = "linkedin_ads"
+    POSTGRES_POOL_SIZE: int = 5
+    POSTGRES_MAX_OVERFLOW: int = 10
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -9,7 +9,15 @@ from sqlmodel import Session, SQLModel
 
 from app.core.config import settings
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, echo=False, pool_pre_ping=True)
+# One engine (and connection pool) for the whole process; sessions borrow
+# connections from it rather than opening their own.
+engine = create_engine(
+    settings.SQLALCHEMY_DATABASE_URI,
+    echo=False,
+    pool_pre_ping=True,
+    pool_size=settings.POSTGRES_POOL_SIZE,
+    max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+)
 
 
 def init_db() -> None:
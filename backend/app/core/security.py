@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlencode
 
@@ -26,6 +27,20 @@ logger = get_logger(__name__)
 _EXPIRY_BUFFER = 300  # 5 minutes
 
 
+@lru_cache(maxsize=8)
+def _authorization_url(client_id: str, redirect_uri: str, state: str) -> str:
+    # AuthManager is built per request, so the URL is memoized at module level
+    # on its inputs rather than on the instance.
+    params = {
+        "response_type": "code",
+        "client_id": client_id,
+        "redirect_uri": redirect_uri,
+        "state": state,
+        "scope": " ".join(SCOPES),
+    }
+    return f"{OAUTH2_BASE_URL}/authorization?{urlencode(params)}"
+
+
 class AuthManager:
     def __init__(self) -> None:
         self.client_id = settings.LINKEDIN_CLIENT_ID
@@ -37,28 +52,21 @@ class AuthManager:
     # -- Persistence ----------------------------------------------------------
 
     def _load_tokens(self) -> dict:
-        if self.tokens_file.exists():
-            with open(self.tokens_file) as f:
-                return json.load(f)
-        return {}
+        try:
+            return json.loads(self.tokens_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
 
     def _save_tokens(self) -> None:
         self.tokens["saved_at"] = int(time.time())
         self.tokens_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.tokens_file, "w") as f:
-            json.dump(self.tokens, f, indent=2)
+        # Encode first, then write once: json.dump streams many small chunks.
+        self.tokens_file.write_text(json.dumps(self.tokens, indent=2), encoding="utf-8")
 
     # -- OAuth flow -----------------------------------------------------------
 
     def get_authorization_url(self) -> str:
-        params = {
-            "response_type": "code",
-            "client_id": self.client_id,
-            "redirect_uri": self.redirect_uri,
-            "state": settings.OAUTH_STATE,
-            "scope": " ".join(SCOPES),
-        }
-        return f"{OAUTH2_BASE_URL}/authorization?{urlencode(params)}"
+        return _authorization_url(self.client_id, self.redirect_uri, settings.OAUTH_STATE)
 
     async def exchange_code_for_token(self, auth_code: str) -> dict:
         url = f"{OAUTH2_BASE_URL}/accessToken"
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import time
 
 from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import Session, select
@@ -12,10 +12,15 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_account_insert = insert(AdAccount)
+_UPSERT_ACCOUNTS = _account_insert.on_conflict_do_update(
+    index_elements=["id"],
+    set_={c.name: c for c in _account_insert.excluded if c.name not in ("id",)},
+)
 
-def upsert_account(session: Session, acct: dict, now: str | None = None) -> None:
-    now = now or datetime.now(tz=timezone.utc).isoformat()
-    values = {
+
+def account_row(acct: dict, now: int) -> dict:
+    return {
         "id": acct["id"],
         "name": acct["name"],
         "status": acct["status"],
@@ -25,12 +30,17 @@ def upsert_account(session: Session, acct: dict, now: str | None = None) -> None
         "created_at": acct.get("created_at"),
         "fetched_at": now,
     }
-    stmt = insert(AdAccount).values(**values)
-    stmt = stmt.on_conflict_do_update(
-        index_elements=["id"],
-        set_={k: stmt.excluded[k] for k in values if k != "id"},
-    )
-    session.exec(stmt)  # type: ignore[call-overload]
+
+
+def upsert_accounts(session: Session, rows: list[dict]) -> None:
+    """Upsert pre-built account rows in one executemany statement."""
+    if not rows:
+        return
+    session.exec(_UPSERT_ACCOUNTS, params=rows)  # type: ignore[call-overload]
+
+
+def upsert_account(session: Session, acct: dict, now: int | None = None) -> None:
+    upsert_accounts(session, [account_row(acct, now or int(time.time()))])
 
 
 def get_accounts(session: Session) -> list[AdAccount]:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import time
 
 from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import Session, select
@@ -10,40 +10,59 @@ from sqlmodel import Session, select
 from app.models.ad_account import AdAccount
 from app.models.campaign import Campaign
 from app.utils.logging import get_logger
+from app.utils.timestamps import iso_fetched_at
 
 logger = get_logger(__name__)
 
+_campaign_insert = insert(Campaign)
+_UPSERT_CAMPAIGNS = _campaign_insert.on_conflict_do_update(
+    index_elements=["id"],
+    set_={c.name: c for c in _campaign_insert.excluded if c.name not in ("id",)},
+)
 
-def upsert_campaign(
-    session: Session, account_id: int, camp: dict, now: str | None = None,
-) -> None:
-    now = now or datetime.now(tz=timezone.utc).isoformat()
+
+def _to_float(value: str | float | None) -> float | None:
+    """Parse a LinkedIn amount string; missing amounts stay NULL."""
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+def campaign_row(account_id: int, camp: dict, now: int) -> dict:
     s = camp.get("settings", {})
-    values = {
+    get = s.get
+    return {
         "id": camp["id"],
         "account_id": account_id,
         "name": camp["name"],
         "status": camp["status"],
         "type": camp.get("type"),
-        "daily_budget": float(s.get("daily_budget") or 0),
-        "daily_budget_currency": s.get("daily_budget_currency"),
-        "total_budget": float(s.get("total_budget") or 0),
-        "cost_type": s.get("cost_type"),
-        "unit_cost": float(s.get("unit_cost") or 0),
-        "bid_strategy": s.get("bid_strategy"),
-        "creative_selection": s.get("creative_selection"),
-        "offsite_delivery_enabled": s.get("offsite_delivery_enabled", False),
-        "audience_expansion_enabled": s.get("audience_expansion_enabled", False),
-        "campaign_group": s.get("campaign_group"),
+        "daily_budget": _to_float(get("daily_budget")),
+        "daily_budget_currency": get("daily_budget_currency"),
+        "total_budget": _to_float(get("total_budget")),
+        "cost_type": get("cost_type"),
+        "unit_cost": _to_float(get("unit_cost")),
+        "bid_strategy": get("bid_strategy"),
+        "creative_selection": get("creative_selection"),
+        "offsite_delivery_enabled": get("offsite_delivery_enabled", False),
+        "audience_expansion_enabled": get("audience_expansion_enabled", False),
+        "campaign_group": get("campaign_group"),
         "created_at": camp.get("created_at"),
         "fetched_at": now,
     }
-    stmt = insert(Campaign).values(**values)
-    stmt = stmt.on_conflict_do_update(
-        index_elements=["id"],
-        set_={k: stmt.excluded[k] for k in values if k != "id"},
-    )
-    session.exec(stmt)  # type: ignore[call-overload]
+
+
+def upsert_campaigns(session: Session, rows: list[dict]) -> None:
+    """Upsert pre-built campaign rows in one executemany statement."""
+    if not rows:
+        return
+    session.exec(_UPSERT_CAMPAIGNS, params=rows)  # type: ignore[call-overload]
+
+
+def upsert_campaign(
+    session: Session, account_id: int, camp: dict, now: int | None = None,
+) -> None:
+    upsert_campaigns(session, [campaign_row(account_id, camp, now or int(time.time()))])
 
 
 def get_campaigns(session: Session) -> list[dict]:
@@ -56,7 +75,7 @@ def get_campaigns(session: Session) -> list[dict]:
     rows = session.exec(stmt).all()
     result = []
     for camp, account_name in rows:
-        d = camp.model_dump()
+        d = iso_fetched_at(camp.model_dump())
         d["account_name"] = account_name
         result.append(d)
     return result
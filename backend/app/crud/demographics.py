@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import time
 from typing import Optional
 
 from sqlalchemy.dialects.postgresql import insert
@@ -10,39 +10,55 @@ from sqlmodel import Session, select
 
 from app.models.demographics import AudienceDemographic
 from app.utils.logging import get_logger
+from app.utils.timestamps import iso_fetched_at
 
 logger = get_logger(__name__)
 
+_demographic_insert = insert(AudienceDemographic)
+_UPSERT_DEMOGRAPHICS = _demographic_insert.on_conflict_do_update(
+    index_elements=["account_id", "pivot_type", "segment", "date_start"],
+    set_={
+        c.name: c
+        for c in _demographic_insert.excluded
+        if c.name not in ("account_id", "pivot_type", "segment", "date_start")
+    },
+)
 
-def upsert_demographics(
-    session: Session, acct: dict, date_range: dict, now: str | None = None,
-) -> None:
-    now = now or datetime.now(tz=timezone.utc).isoformat()
+
+def demographic_rows(acct: dict, date_range: dict, now: int) -> list[dict]:
+    account_id = acct["id"]
+    date_start = date_range.get("start", "")
+    date_end = date_range.get("end", "")
+    rows = []
     for pivot_type, segments in acct.get("audience_demographics", {}).items():
         for seg in segments:
-            values = {
-                "account_id": acct["id"],
+            get = seg.get
+            rows.append({
+                "account_id": account_id,
                 "pivot_type": pivot_type,
-                "segment": seg.get("segment", "?"),
-                "impressions": seg.get("impressions", 0),
-                "clicks": seg.get("clicks", 0),
-                "ctr": seg.get("ctr", 0),
-                "share_pct": seg.get("share_of_impressions", 0),
-                "date_start": date_range.get("start", ""),
-                "date_end": date_range.get("end", ""),
+                "segment": get("segment", "?"),
+                "impressions": get("impressions", 0),
+                "clicks": get("clicks", 0),
+                "ctr": get("ctr", 0),
+                "share_pct": get("share_of_impressions", 0),
+                "date_start": date_start,
+                "date_end": date_end,
                 "fetched_at": now,
-            }
-            stmt = insert(AudienceDemographic).values(**values)
-            update_cols = {
-                k: stmt.excluded[k]
-                for k in values
-                if k not in ("account_id", "pivot_type", "segment", "date_start")
-            }
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["account_id", "pivot_type", "segment", "date_start"],
-                set_=update_cols,
-            )
-            session.exec(stmt)  # type: ignore[call-overload]
+            })
+    return rows
+
+
+def upsert_demographic_rows(session: Session, rows: list[dict]) -> None:
+    """Upsert pre-built demographic rows in one executemany statement."""
+    if not rows:
+        return
+    session.exec(_UPSERT_DEMOGRAPHICS, params=rows)  # type: ignore[call-overload]
+
+
+def upsert_demographics(
+    session: Session, acct: dict, date_range: dict, now: int | None = None,
+) -> None:
+    upsert_demographic_rows(session, demographic_rows(acct, date_range, now or int(time.time())))
 
 
 def get_demographics(
@@ -59,4 +75,4 @@ def get_demographics(
             AudienceDemographic.pivot_type,
             AudienceDemographic.impressions.desc(),  # type: ignore[union-attr]
         )
-    return [r.model_dump() for r in session.exec(stmt).all()]
+    return [iso_fetched_at(r.model_dump()) for r in session.exec(stmt).all()]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import math
-from datetime import datetime, timezone
+import time
 
 from sqlalchemy import func, text
 from sqlalchemy.dialects.postgresql import insert
@@ -13,25 +13,82 @@ from app.models.campaign import Campaign
 from app.models.creative import Creative
 from app.models.metrics import CampaignDailyMetric, CreativeDailyMetric
 from app.utils.logging import get_logger
+from app.utils.timestamps import iso_fetched_at
 
 logger = get_logger(__name__)
 
 
+def _field_columns(model: type) -> tuple:
+    """Return *model*'s table columns in field order."""
+    table = model.__table__  # type: ignore[attr-defined]
+    return tuple(table.c[name] for name in model.model_fields)  # type: ignore[attr-defined]
+
+
+# Conflict updates rewrite every non-key column in place (no DELETE, so
+# FK children are untouched); statements are built once at import.
+_campaign_metric_insert = insert(CampaignDailyMetric)
+_UPSERT_CAMPAIGN_METRICS = _campaign_metric_insert.on_conflict_do_update(
+    index_elements=["campaign_id", "date"],
+    set_={
+        c.name: c
+        for c in _campaign_metric_insert.excluded
+        if c.name not in ("campaign_id", "date")
+    },
+)
+_creative_metric_insert = insert(CreativeDailyMetric)
+_UPSERT_CREATIVE_METRICS = _creative_metric_insert.on_conflict_do_update(
+    index_elements=["creative_id", "date"],
+    set_={
+        c.name: c
+        for c in _creative_metric_insert.excluded
+        if c.name not in ("creative_id", "date")
+    },
+)
+_creative_insert = insert(Creative)
+_UPSERT_CREATIVES = _creative_insert.on_conflict_do_update(
+    index_elements=["id"],
+    set_={c.name: c for c in _creative_insert.excluded if c.name not in ("id", "created_at")},
+)
+
+# Report queries select plain columns and return row mappings, so pages are
+# built without instantiating (and then dumping) an ORM object per row. Keys
+# are the models' fields, in field order.
+_CAMPAIGN_METRIC_COLUMNS = _field_columns(CampaignDailyMetric)
+_CREATIVE_METRIC_COLUMNS = _field_columns(CreativeDailyMetric)
+_CREATIVE_COLUMNS = _field_columns(Creative)
+
+_VISUAL_TIME_SERIES_SQL = text(
+    """SELECT date, SUM(impressions) as impressions, SUM(clicks) as clicks,
+              SUM(spend) as spend, SUM(conversions) as conversions
+       FROM campaign_daily_metrics
+       GROUP BY date ORDER BY date"""
+)
+_VISUAL_CAMPAIGN_COMPARISON_SQL = text(
+    """SELECT c.name, SUM(cdm.impressions) as impressions, SUM(cdm.clicks) as clicks,
+              SUM(cdm.spend) as spend, SUM(cdm.conversions) as conversions
+       FROM campaign_daily_metrics cdm
+       JOIN campaigns c ON cdm.campaign_id = c.id
+       GROUP BY cdm.campaign_id, c.name
+       ORDER BY SUM(cdm.spend) DESC"""
+)
+_VISUAL_SUMMARY_SQL = text(
+    """SELECT COALESCE(SUM(impressions), 0) as total_impressions,
+              COALESCE(SUM(clicks), 0) as total_clicks,
+              COALESCE(SUM(spend), 0) as total_spend,
+              COALESCE(SUM(conversions), 0) as total_conversions
+       FROM campaign_daily_metrics"""
+)
+
+
 # ---------------------------------------------------------------------------
 # Upserts
 # ---------------------------------------------------------------------------
 
-def upsert_campaign_daily_metrics(
-    session: Session, camp: dict, now: str | None = None,
-) -> None:
-    now = now or datetime.now(tz=timezone.utc).isoformat()
-    rows = camp.get("daily_metrics", [])
-    if not rows:
-        return
-
-    for day in rows:
-        values = {
-            "campaign_id": camp["id"],
+def campaign_metric_rows(camp: dict, now: int) -> list[dict]:
+    campaign_id = camp["id"]
+    return [
+        {
+            "campaign_id": campaign_id,
             "date": day["date"],
             "impressions": day.get("impressions", 0),
             "clicks": day.get("clicks", 0),
@@ -49,26 +106,15 @@ def upsert_campaign_daily_metrics(
             "cpc": day.get("cpc", 0),
             "fetched_at": now,
         }
-        stmt = insert(CampaignDailyMetric).values(**values)
-        update_cols = {k: stmt.excluded[k] for k in values if k not in ("campaign_id", "date")}
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["campaign_id", "date"],
-            set_=update_cols,
-        )
-        session.exec(stmt)  # type: ignore[call-overload]
+        for day in camp.get("daily_metrics", [])
+    ]
 
 
-def upsert_creative_daily_metrics(
-    session: Session, creative: dict, now: str | None = None,
-) -> None:
-    now = now or datetime.now(tz=timezone.utc).isoformat()
-    rows = creative.get("daily_metrics", [])
-    if not rows:
-        return
-
-    for day in rows:
-        values = {
-            "creative_id": creative["id"],
+def creative_metric_rows(creative: dict, now: int) -> list[dict]:
+    creative_id = creative["id"]
+    return [
+        {
+            "creative_id": creative_id,
             "date": day["date"],
             "impressions": day.get("impressions", 0),
             "clicks": day.get("clicks", 0),
@@ -86,26 +132,20 @@ def upsert_creative_daily_metrics(
             "cpc": day.get("cpc", 0),
             "fetched_at": now,
         }
-        stmt = insert(CreativeDailyMetric).values(**values)
-        update_cols = {k: stmt.excluded[k] for k in values if k not in ("creative_id", "date")}
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["creative_id", "date"],
-            set_=update_cols,
-        )
-        session.exec(stmt)  # type: ignore[call-overload]
+        for day in creative.get("daily_metrics", [])
+    ]
 
 
-def upsert_creatives(
-    session: Session, account_id: int, camp: dict, now: str | None = None,
-) -> None:
-    now = now or datetime.now(tz=timezone.utc).isoformat()
+def creative_rows(account_id: int, camp: dict, now: int) -> list[dict]:
+    campaign_id = camp["id"]
+    rows = []
     for cr in camp.get("creatives", []):
         hold_reasons = cr.get("serving_hold_reasons")
         if isinstance(hold_reasons, list):
             hold_reasons = ",".join(hold_reasons) if hold_reasons else None
-        values = {
+        rows.append({
             "id": cr.get("id", ""),
-            "campaign_id": camp["id"],
+            "campaign_id": campaign_id,
             "account_id": account_id,
             "intended_status": cr.get("intended_status"),
             "is_serving": cr.get("is_serving", False),
@@ -115,11 +155,47 @@ def upsert_creatives(
             "created_at": cr.get("created_at"),
             "last_modified_at": cr.get("last_modified_at"),
             "fetched_at": now,
-        }
-        stmt = insert(Creative).values(**values)
-        update_cols = {k: stmt.excluded[k] for k in values if k not in ("id", "created_at")}
-        stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=update_cols)
-        session.exec(stmt)  # type: ignore[call-overload]
+        })
+    return rows
+
+
+def upsert_campaign_metric_rows(session: Session, rows: list[dict]) -> None:
+    """Upsert pre-built campaign metric rows in one executemany statement."""
+    if not rows:
+        return
+    session.exec(_UPSERT_CAMPAIGN_METRICS, params=rows)  # type: ignore[call-overload]
+
+
+def upsert_creative_metric_rows(session: Session, rows: list[dict]) -> None:
+    """Upsert pre-built creative metric rows in one executemany statement."""
+    if not rows:
+        return
+    session.exec(_UPSERT_CREATIVE_METRICS, params=rows)  # type: ignore[call-overload]
+
+
+def upsert_creative_rows(session: Session, rows: list[dict]) -> None:
+    """Upsert pre-built creative rows in one executemany statement."""
+    if not rows:
+        return
+    session.exec(_UPSERT_CREATIVES, params=rows)  # type: ignore[call-overload]
+
+
+def upsert_campaign_daily_metrics(
+    session: Session, camp: dict, now: int | None = None,
+) -> None:
+    upsert_campaign_metric_rows(session, campaign_metric_rows(camp, now or int(time.time())))
+
+
+def upsert_creative_daily_metrics(
+    session: Session, creative: dict, now: int | None = None,
+) -> None:
+    upsert_creative_metric_rows(session, creative_metric_rows(creative, now or int(time.time())))
+
+
+def upsert_creatives(
+    session: Session, account_id: int, camp: dict, now: int | None = None,
+) -> None:
+    upsert_creative_rows(session, creative_rows(account_id, camp, now or int(time.time())))
 
 
 # ---------------------------------------------------------------------------
@@ -135,18 +211,13 @@ def get_campaign_metrics_paginated(
     offset = (page - 1) * page_size
 
     stmt = (
-        select(CampaignDailyMetric, Campaign.name.label("campaign_name"))  # type: ignore[attr-defined]
+        select(*_CAMPAIGN_METRIC_COLUMNS, Campaign.name.label("campaign_name"))  # type: ignore[attr-defined]
         .outerjoin(Campaign, CampaignDailyMetric.campaign_id == Campaign.id)
         .order_by(CampaignDailyMetric.date.desc(), CampaignDailyMetric.campaign_id)  # type: ignore[union-attr]
         .offset(offset)
         .limit(page_size)
     )
-    rows = session.exec(stmt).all()
-    result = []
-    for metric, campaign_name in rows:
-        d = metric.model_dump()
-        d["campaign_name"] = campaign_name
-        result.append(d)
+    result = [iso_fetched_at(dict(row)) for row in session.exec(stmt).mappings()]
 
     return {
         "rows": result,
@@ -167,7 +238,7 @@ def get_creative_metrics_paginated(
 
     stmt = (
         select(
-            CreativeDailyMetric,
+            *_CREATIVE_METRIC_COLUMNS,
             Creative.content_name.label("content_name"),  # type: ignore[attr-defined]
             Campaign.name.label("campaign_name"),  # type: ignore[attr-defined]
         )
@@ -177,13 +248,7 @@ def get_creative_metrics_paginated(
         .offset(offset)
         .limit(page_size)
     )
-    rows = session.exec(stmt).all()
-    result = []
-    for metric, content_name, campaign_name in rows:
-        d = metric.model_dump()
-        d["content_name"] = content_name
-        d["campaign_name"] = campaign_name
-        result.append(d)
+    result = [iso_fetched_at(dict(row)) for row in session.exec(stmt).mappings()]
 
     return {
         "rows": result,
@@ -197,17 +262,11 @@ def get_creative_metrics_paginated(
 def get_creatives(session: Session) -> list[dict]:
     """Return all creatives with campaign name via JOIN."""
     stmt = (
-        select(Creative, Campaign.name.label("campaign_name"))  # type: ignore[attr-defined]
+        select(*_CREATIVE_COLUMNS, Campaign.name.label("campaign_name"))  # type: ignore[attr-defined]
         .outerjoin(Campaign, Creative.campaign_id == Campaign.id)
         .order_by(Creative.last_modified_at.desc())  # type: ignore[union-attr]
     )
-    rows = session.exec(stmt).all()
-    result = []
-    for cr, campaign_name in rows:
-        d = cr.model_dump()
-        d["campaign_name"] = campaign_name
-        result.append(d)
-    return result
+    return [iso_fetched_at(dict(row)) for row in session.exec(stmt).mappings()]
 
 
 # ---------------------------------------------------------------------------
@@ -215,46 +274,20 @@ def get_creatives(session: Session) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 def get_visual_data(session: Session) -> dict:
-    # Time series
-    time_series = session.exec(text(
-        """SELECT date, SUM(impressions) as impressions, SUM(clicks) as clicks,
-                  SUM(spend) as spend, SUM(conversions) as conversions
-           FROM campaign_daily_metrics
-           GROUP BY date ORDER BY date"""
-    )).all()
-
-    # Campaign comparison
-    campaign_comparison = session.exec(text(
-        """SELECT c.name, SUM(cdm.impressions) as impressions, SUM(cdm.clicks) as clicks,
-                  SUM(cdm.spend) as spend, SUM(cdm.conversions) as conversions
-           FROM campaign_daily_metrics cdm
-           JOIN campaigns c ON cdm.campaign_id = c.id
-           GROUP BY cdm.campaign_id, c.name
-           ORDER BY SUM(cdm.spend) DESC"""
-    )).all()
-
-    # Summary KPIs
-    summary = session.exec(text(
-        """SELECT COALESCE(SUM(impressions), 0) as total_impressions,
-                  COALESCE(SUM(clicks), 0) as total_clicks,
-                  COALESCE(SUM(spend), 0) as total_spend,
-                  COALESCE(SUM(conversions), 0) as total_conversions
-           FROM campaign_daily_metrics"""
-    )).one()
-
-    total_imp = summary[0]
-    total_clk = summary[1]
-    total_spend = summary[2]
-    total_conv = summary[3]
+    time_series = session.exec(_VISUAL_TIME_SERIES_SQL).all()
+    campaign_comparison = session.exec(_VISUAL_CAMPAIGN_COMPARISON_SQL).all()
+    summary = session.exec(_VISUAL_SUMMARY_SQL).one()
+
+    total_imp, total_clk, total_spend, total_conv = summary
 
     return {
         "time_series": [
-            {"date": r[0], "impressions": r[1], "clicks": r[2], "spend": r[3], "conversions": r[4]}
-            for r in time_series
+            {"date": day, "impressions": imp, "clicks": clk, "spend": spend, "conversions": conv}
+            for day, imp, clk, spend, conv in time_series
         ],
         "campaign_comparison": [
-            {"name": r[0], "impressions": r[1], "clicks": r[2], "spend": r[3], "conversions": r[4]}
-            for r in campaign_comparison
+            {"name": name, "impressions": imp, "clicks": clk, "spend": spend, "conversions": conv}
+            for name, imp, clk, spend, conv in campaign_comparison
         ],
         "kpis": {
             "impressions": total_imp,
@@ -0,0 +1,101 @@
+"""Persist an assembled snapshot to the database."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections.abc import Iterable
+from operator import itemgetter
+
+from sqlmodel import Session
+
+from app.crud.accounts import account_row, upsert_accounts
+from app.crud.campaigns import campaign_row, upsert_campaigns
+from app.crud.demographics import demographic_rows, upsert_demographic_rows
+from app.crud.metrics import (
+    campaign_metric_rows,
+    creative_metric_rows,
+    creative_rows,
+    upsert_campaign_metric_rows,
+    upsert_creative_metric_rows,
+    upsert_creative_rows,
+)
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def snapshot_digest(snapshot: dict) -> str:
+    """Stable content hash of a snapshot, ignoring its ``generated_at`` stamp."""
+    content = {k: v for k, v in snapshot.items() if k != "generated_at"}
+    encoded = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+def _collect_rows(snapshot: dict, now: int) -> dict[str, list[dict]]:
+    """Walk the snapshot once and bucket row params by table."""
+    date_range = snapshot.get("date_range", {})
+    rows: dict[str, list[dict]] = {
+        "ad_accounts": [],
+        "campaigns": [],
+        "creatives": [],
+        "campaign_daily_metrics": [],
+        "creative_daily_metrics": [],
+        "audience_demographics": [],
+    }
+    for acct in snapshot.get("accounts", []):
+        account_id = acct["id"]
+        rows["ad_accounts"].append(account_row(acct, now))
+        for camp in acct.get("campaigns", []):
+            rows["campaigns"].append(campaign_row(account_id, camp, now))
+            rows["campaign_daily_metrics"].extend(campaign_metric_rows(camp, now))
+            rows["creatives"].extend(creative_rows(account_id, camp, now))
+            for cr in camp.get("creatives", []):
+                rows["creative_daily_metrics"].extend(creative_metric_rows(cr, now))
+        rows["audience_demographics"].extend(demographic_rows(acct, date_range, now))
+    return rows
+
+
+# Upsert conflict target per table. A batch must not hit the same key twice
+# (PostgreSQL rejects a multi-row ON CONFLICT that touches one row twice).
+_CONFLICT_KEYS: dict[str, itemgetter] = {
+    "ad_accounts": itemgetter("id"),
+    "campaigns": itemgetter("id"),
+    "creatives": itemgetter("id"),
+    "campaign_daily_metrics": itemgetter("campaign_id", "date"),
+    "creative_daily_metrics": itemgetter("creative_id", "date"),
+    "audience_demographics": itemgetter("account_id", "pivot_type", "segment", "date_start"),
+}
+
+
+def persist_snapshot(session: Session, snapshot: dict, now: int | None = None) -> None:
+    """Upsert every table in the snapshot and commit once."""
+    persist_snapshots(session, [snapshot], now)
+
+
+def persist_snapshots(session: Session, snapshots: Iterable[dict], now: int | None = None) -> None:
+    """Upsert any number of snapshots in one transaction.
+
+    Rows are collected across all snapshots and accounts first, de-duplicated
+    on each table's conflict key (the last occurrence wins, as with sequential
+    upserts), then written with one executemany statement per table in
+    foreign-key order.
+    """
+    now = now or int(time.time())
+    buckets: dict[str, dict] = {table: {} for table in _CONFLICT_KEYS}
+    for snapshot in snapshots:
+        for table, table_rows in _collect_rows(snapshot, now).items():
+            key = _CONFLICT_KEYS[table]
+            bucket = buckets[table]
+            for row in table_rows:
+                bucket[key(row)] = row
+
+    rows = {table: list(bucket.values()) for table, bucket in buckets.items()}
+    upsert_accounts(session, rows["ad_accounts"])
+    upsert_campaigns(session, rows["campaigns"])
+    upsert_campaign_metric_rows(session, rows["campaign_daily_metrics"])
+    upsert_creative_rows(session, rows["creatives"])
+    upsert_creative_metric_rows(session, rows["creative_daily_metrics"])
+    upsert_demographic_rows(session, rows["audience_demographics"])
+    session.commit()
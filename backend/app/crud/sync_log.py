@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import time
 
-from sqlmodel import Session, select
+from sqlalchemy import text
+from sqlmodel import Session
 
 from app.core.config import settings
 from app.models.sync import SyncLog
@@ -12,26 +13,61 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Static SQL is built once at import so every call reuses the same
+# construct (and SQLAlchemy's compiled-statement cache entry).
+_COUNTED_TABLES = (
+    "ad_accounts", "campaigns", "creatives",
+    "campaign_daily_metrics", "creative_daily_metrics",
+    "audience_demographics",
+)
+# One row of scalar subqueries: a single statement and round trip for all
+# counts instead of one per table.
+_TABLE_COUNT_SQL = text(
+    "SELECT "
+    + ", ".join(f"(SELECT COUNT(*) FROM {t}) AS {t}" for t in _COUNTED_TABLES)  # noqa: S608
+)
+_ACTIVE_AUDIT_SQL = text(
+    """SELECT name,
+              COALESCE(offsite_delivery_enabled, FALSE) AS lan_enabled,
+              COALESCE(audience_expansion_enabled, FALSE) AS audience_expansion,
+              COALESCE(cost_type = 'CPM', FALSE) AS max_delivery
+       FROM campaigns WHERE status = 'ACTIVE'"""
+)
+
+# Freshness gate: elapsed minutes and the stale/fresh decision are both
+# computed by the database, so only two scalars come back.
+_LAST_SUCCESS_SQL = text(
+    """SELECT (:now - finished_at) / 60.0 AS elapsed_min,
+              (:now - finished_at) >= :ttl_seconds AS stale
+       FROM sync_log
+       WHERE account_id = :account_id AND status = 'success'
+       ORDER BY finished_at DESC
+       LIMIT 1"""
+)
+_LAST_SNAPSHOT_HASH_SQL = text(
+    """SELECT snapshot_hash
+       FROM sync_log
+       WHERE account_id = :account_id AND status = 'success'
+       ORDER BY finished_at DESC
+       LIMIT 1"""
+)
+
 
 def should_sync(session: Session, account_id: str, force: bool = False) -> tuple[bool, str]:
     if force:
         return True, "force=True"
 
     ttl = settings.FRESHNESS_TTL_MINUTES
-    stmt = (
-        select(SyncLog.finished_at)
-        .where(SyncLog.account_id == account_id, SyncLog.status == "success")
-        .order_by(SyncLog.finished_at.desc())  # type: ignore[union-attr]
-        .limit(1)
-    )
-    row = session.exec(stmt).first()
+    row = session.exec(  # type: ignore[call-overload]
+        _LAST_SUCCESS_SQL,
+        params={"now": int(time.time()), "ttl_seconds": ttl * 60, "account_id": account_id},
+    ).first()
 
     if row is None:
         return True, "no previous successful sync"
 
-    last_finished = datetime.fromisoformat(row)
-    elapsed = (datetime.now(tz=timezone.utc) - last_finished).total_seconds() / 60
-    if elapsed >= ttl:
+    elapsed, stale = row
+    if stale:
         return True, f"last sync {elapsed:.0f}m ago (ttl={ttl}m)"
     return False, f"fresh ({elapsed:.0f}m ago, ttl={ttl}m)"
 
@@ -39,8 +75,7 @@ def should_sync(session: Session, account_id: str, force: bool = False) -> tuple
 def start_sync_run(
     session: Session, account_id: str, trigger: str = "manual",
 ) -> int:
-    now = datetime.now(tz=timezone.utc).isoformat()
-    log = SyncLog(account_id=account_id, started_at=now, trigger=trigger)
+    log = SyncLog(account_id=account_id, started_at=int(time.time()), trigger=trigger)
     session.add(log)
     session.commit()
     session.refresh(log)
@@ -53,6 +88,7 @@ def finish_sync_run(
     run_id: int,
     status: str = "success",
     stats: dict | None = None,
+    now: int | None = None,
 ) -> None:
     stats = stats or {}
     log = session.get(SyncLog, run_id)
@@ -60,49 +96,48 @@ def finish_sync_run(
         logger.warning("Sync log %d not found", run_id)
         return
 
-    log.finished_at = datetime.now(tz=timezone.utc).isoformat()
+    log.finished_at = int(time.time()) if now is None else now
     log.status = status
     log.campaigns_fetched = stats.get("campaigns_fetched", 0)
     log.creatives_fetched = stats.get("creatives_fetched", 0)
     log.api_calls_made = stats.get("api_calls_made", 0)
     log.errors = stats.get("errors")
+    log.snapshot_hash = stats.get("snapshot_hash")
     session.add(log)
     session.commit()
     logger.info("Finished sync run %d: %s", run_id, status)
 
 
+def last_snapshot_hash(session: Session, account_id: str) -> str | None:
+    """Return the snapshot hash recorded by the latest successful run."""
+    row = session.exec(  # type: ignore[call-overload]
+        _LAST_SNAPSHOT_HASH_SQL, params={"account_id": account_id},
+    ).first()
+    return row[0] if row else None
+
+
 def table_counts(session: Session) -> dict[str, int]:
     """Return row counts for every table."""
-    from sqlalchemy import text
-    tables = [
-        "ad_accounts", "campaigns", "creatives",
-        "campaign_daily_metrics", "creative_daily_metrics",
-        "audience_demographics",
-    ]
-    counts = {}
-    for t in tables:
-        result = session.exec(text(f"SELECT COUNT(*) FROM {t}"))  # noqa: S608
-        counts[t] = result.one()[0]
-    return counts
+    row = session.exec(_TABLE_COUNT_SQL).one()  # type: ignore[call-overload]
+    return dict(zip(_COUNTED_TABLES, row))
 
 
 def active_campaign_audit(session: Session) -> list[dict]:
-    """Return active campaigns with potential settings issues."""
-    from sqlalchemy import text
-    rows = session.exec(text(
-        """SELECT name, status, offsite_delivery_enabled, audience_expansion_enabled,
-                  cost_type, daily_budget
-           FROM campaigns WHERE status = 'ACTIVE'"""
-    )).all()
+    """Return active campaigns with potential settings issues.
+
+    Issue flags are evaluated in SQL so only booleans cross the driver
+    boundary; the partial index ``ix_campaigns_active`` covers the scan.
+    """
+    rows = session.exec(_ACTIVE_AUDIT_SQL).all()
 
     results = []
-    for r in rows:
+    for name, lan_enabled, audience_expansion, max_delivery in rows:
         issues = []
-        if r[2]:  # offsite_delivery_enabled
+        if lan_enabled:
             issues.append("LAN enabled")
-        if r[3]:  # audience_expansion_enabled
+        if audience_expansion:
             issues.append("Audience Expansion ON")
-        if r[4] == "CPM":  # cost_type
+        if max_delivery:
             issues.append("Maximum Delivery (CPM)")
-        results.append({"name": r[0], "issues": issues})
+        results.append({"name": name, "issues": issues})
     return results
@@ -87,10 +87,7 @@ class ConfigurationError(LinkedInActionCenterError):
         message: str,
         config_key: Optional[str] = None,
     ):
-        details: dict[str, Any] = {}
-        if config_key:
-            details["config_key"] = config_key
-        super().__init__(message, details)
+        super().__init__(message, {"config_key": config_key} if config_key else None)
         self.config_key = config_key
 
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
+from sqlalchemy import BigInteger, Column
 from sqlmodel import Field, SQLModel
 
 
@@ -15,4 +16,4 @@ class AdAccount(SQLModel, table=True):
     type: Optional[str] = None
     is_test: Optional[bool] = None
     created_at: Optional[str] = Field(default=None)
-    fetched_at: Optional[str] = None
+    fetched_at: Optional[int] = Field(default=None, sa_column=Column(BigInteger))
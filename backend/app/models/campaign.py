@@ -2,11 +2,22 @@ from __future__ import annotations
 
 from typing import Optional
 
+from sqlalchemy import BigInteger, Column, Index, text
 from sqlmodel import Field, SQLModel
 
 
 class Campaign(SQLModel, table=True):
     __tablename__ = "campaigns"
+    __table_args__ = (
+        # Partial covering index for active_campaign_audit.
+        Index(
+            "ix_campaigns_active",
+            "name",
+            postgresql_where=text("status = 'ACTIVE'"),
+            postgresql_include=["offsite_delivery_enabled", "audience_expansion_enabled", "cost_type"],
+            sqlite_where=text("status = 'ACTIVE'"),
+        ),
+    )
 
     id: int = Field(primary_key=True)
     account_id: Optional[int] = Field(default=None, foreign_key="ad_accounts.id")
@@ -24,4 +35,4 @@ class Campaign(SQLModel, table=True):
     audience_expansion_enabled: Optional[bool] = None
     campaign_group: Optional[str] = None
     created_at: Optional[str] = Field(default=None)
-    fetched_at: Optional[str] = None
+    fetched_at: Optional[int] = Field(default=None, sa_column=Column(BigInteger))
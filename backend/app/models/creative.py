@@ -19,4 +19,4 @@ class Creative(SQLModel, table=True):
     serving_hold_reasons: Optional[str] = None
     created_at: Optional[int] = Field(default=None, sa_column=Column(BigInteger))
     last_modified_at: Optional[int] = Field(default=None, sa_column=Column(BigInteger))
-    fetched_at: Optional[str] = None
+    fetched_at: Optional[int] = Field(default=None, sa_column=Column(BigInteger))
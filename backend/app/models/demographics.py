@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
+from sqlalchemy import BigInteger, Column
 from sqlmodel import Field, SQLModel
 
 
@@ -17,4 +18,4 @@ class AudienceDemographic(SQLModel, table=True):
     ctr: float = 0.0
     share_pct: float = 0.0
     date_end: Optional[str] = None
-    fetched_at: Optional[str] = None
+    fetched_at: Optional[int] = Field(default=None, sa_column=Column(BigInteger))
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
+from sqlalchemy import BigInteger, Column
 from sqlmodel import Field, SQLModel
 
 
@@ -24,7 +25,7 @@ class CampaignDailyMetric(SQLModel, table=True):
     sends: int = 0
     ctr: float = 0.0
     cpc: float = 0.0
-    fetched_at: Optional[str] = None
+    fetched_at: Optional[int] = Field(default=None, sa_column=Column(BigInteger))
 
 
 class CreativeDailyMetric(SQLModel, table=True):
@@ -46,4 +47,4 @@ class CreativeDailyMetric(SQLModel, table=True):
     sends: int = 0
     ctr: float = 0.0
     cpc: float = 0.0
-    fetched_at: Optional[str] = None
+    fetched_at: Optional[int] = Field(default=None, sa_column=Column(BigInteger))
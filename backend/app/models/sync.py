@@ -2,19 +2,25 @@ from __future__ import annotations
 
 from typing import Optional
 
+from sqlalchemy import BigInteger, Column, Index, text
 from sqlmodel import Field, SQLModel
 
 
 class SyncLog(SQLModel, table=True):
     __tablename__ = "sync_log"
+    __table_args__ = (
+        # Serves should_sync's latest-successful-run lookup as a single seek.
+        Index("ix_sync_log_freshness", "account_id", "status", text("finished_at DESC")),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     account_id: str
-    started_at: str
-    finished_at: Optional[str] = None
+    started_at: int = Field(sa_column=Column(BigInteger, nullable=False))
+    finished_at: Optional[int] = Field(default=None, sa_column=Column(BigInteger))
     status: str = "running"
     trigger: Optional[str] = None
     campaigns_fetched: int = 0
     creatives_fetched: int = 0
     api_calls_made: int = 0
     errors: Optional[str] = None
+    snapshot_hash: Optional[str] = None
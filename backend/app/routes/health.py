@@ -10,11 +10,13 @@ from app.core.deps import get_db
 
 router = APIRouter()
 
+_PING_SQL = text("SELECT 1")
+
 
 @router.get("")
 def health(session: Session = Depends(get_db)):
     try:
-        session.exec(text("SELECT 1"))
+        session.exec(_PING_SQL)
         return {"status": "ok", "database": "connected"}
     except Exception as exc:
         return {"status": "degraded", "database": str(exc)}
@@ -16,6 +16,7 @@ from app.crud.metrics import (
     get_visual_data,
 )
 from app.utils.logging import get_logger
+from app.utils.timestamps import iso_fetched_at
 
 logger = get_logger(__name__)
 router = APIRouter()
@@ -65,4 +66,4 @@ def campaigns_list(session: Session = Depends(get_db)):
 @router.get("/accounts")
 def accounts_list(session: Session = Depends(get_db)):
     accounts = get_accounts(session)
-    return {"rows": [a.model_dump() for a in accounts]}
+    return {"rows": [iso_fetched_at(a.model_dump()) for a in accounts]}
@@ -6,12 +6,17 @@ with updated imports for the new package layout.
 
 from __future__ import annotations
 
+import copy
 import datetime as _dt
+import heapq
 import json
+from collections import defaultdict
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from app.models.linkedin_api import (
     LinkedInAccount,
@@ -25,30 +30,80 @@ from app.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
-def _extract_id_from_urn(urn: str) -> str:
-    return urn.split(":")[-1] if ":" in str(urn) else str(urn)
+# Raw integer metric fields, in the order _aggregate_and_daily unpacks them.
+_INT_METRIC_KEYS = (
+    "impressions", "clicks", "landingPageClicks", "externalWebsiteConversions",
+    "likes", "comments", "shares", "follows", "oneClickLeads", "opens", "sends",
+)
+_get_int_metrics = itemgetter(*_INT_METRIC_KEYS)
+# Matching snapshot field names for the integer totals.
+_INT_TOTAL_KEYS = (
+    "impressions", "clicks", "landing_page_clicks", "conversions",
+    "likes", "comments", "shares", "follows", "leads", "opens", "sends",
+)
 
 
-def _aggregate_metrics(rows: list[dict]) -> dict:
-    agg = {
+def _empty_totals() -> dict:
+    return {
         "impressions": 0, "clicks": 0, "spend": 0.0,
         "landing_page_clicks": 0, "conversions": 0,
         "likes": 0, "comments": 0, "shares": 0,
         "follows": 0, "leads": 0, "opens": 0, "sends": 0,
     }
+
+
+def _aggregate_and_daily(rows: list[dict]) -> tuple[dict, list[dict]]:
+    """Return the metrics summary and the daily time series in one pass."""
+    daily: dict[tuple[int, int, int], dict] = {}
+    total_spend = 0
+    daily_get = daily.get
     for r in rows:
-        agg["impressions"] += r.get("impressions", 0)
-        agg["clicks"] += r.get("clicks", 0)
-        agg["spend"] += float(r.get("costInLocalCurrency", "0") or "0")
-        agg["landing_page_clicks"] += r.get("landingPageClicks", 0)
-        agg["conversions"] += r.get("externalWebsiteConversions", 0)
-        agg["likes"] += r.get("likes", 0)
-        agg["comments"] += r.get("comments", 0)
-        agg["shares"] += r.get("shares", 0)
-        agg["follows"] += r.get("follows", 0)
-        agg["leads"] += r.get("oneClickLeads", 0)
-        agg["opens"] += r.get("opens", 0)
-        agg["sends"] += r.get("sends", 0)
+        rget = r.get
+        try:
+            imp, clk, lpc, conv, likes, comments, shares, follows, leads, opens, sends = _get_int_metrics(r)
+        except KeyError:
+            # LinkedIn omits zero-valued fields on some rows
+            imp, clk, lpc, conv, likes, comments, shares, follows, leads, opens, sends = [
+                rget(k, 0) for k in _INT_METRIC_KEYS
+            ]
+        # Spend is summed as integer micro-units (LinkedIn reports at most six
+        # decimals), so totals are exact and independent of summation order.
+        spend = round(float(rget("costInLocalCurrency", "0") or "0") * 1_000_000)
+        total_spend += spend
+
+        start = rget("dateRange", {}).get("start", {})
+        # (year, month, day) tuples hash and sort cheaper than formatted
+        # strings; the ISO date is rendered once per bucket below.
+        date_key = (start.get("year", 0), start.get("month", 0), start.get("day", 0))
+        d = daily_get(date_key)
+        if d is None:
+            # Most pivots report one row per day: seed the bucket directly.
+            daily[date_key] = {
+                "date": date_key, "impressions": imp, "clicks": clk, "spend": spend,
+                "landing_page_clicks": lpc, "conversions": conv,
+                "likes": likes, "comments": comments, "shares": shares,
+                "follows": follows, "leads": leads, "opens": opens, "sends": sends,
+            }
+            continue
+        d["impressions"] += imp
+        d["clicks"] += clk
+        d["spend"] += spend
+        d["landing_page_clicks"] += lpc
+        d["conversions"] += conv
+        d["likes"] += likes
+        d["comments"] += comments
+        d["shares"] += shares
+        d["follows"] += follows
+        d["leads"] += leads
+        d["opens"] += opens
+        d["sends"] += sends
+
+    # Integer totals are reduced from the (far fewer) per-day buckets.
+    agg = _empty_totals()
+    for d in daily.values():
+        for k in _INT_TOTAL_KEYS:
+            agg[k] += d[k]
+    agg["spend"] = total_spend / 1_000_000
 
     imp, clk, spend, conv = agg["impressions"], agg["clicks"], agg["spend"], agg["conversions"]
     agg["ctr"] = round(clk / imp * 100, 4) if imp else 0
@@ -56,43 +111,29 @@ def _aggregate_metrics(rows: list[dict]) -> dict:
     agg["cpm"] = round(spend / imp * 1000, 2) if imp else 0
     agg["cpl"] = round(spend / conv, 2) if conv else 0
     agg["spend"] = round(spend, 2)
-    return agg
-
 
-def _daily_time_series(rows: list[dict]) -> list[dict]:
-    daily: dict[str, dict] = {}
-    for r in rows:
-        dr = r.get("dateRange", {})
-        start = dr.get("start", {})
-        date_key = f"{start.get('year', 0)}-{start.get('month', 0):02d}-{start.get('day', 0):02d}"
-        if date_key not in daily:
-            daily[date_key] = {
-                "date": date_key, "impressions": 0, "clicks": 0, "spend": 0.0,
-                "landing_page_clicks": 0, "conversions": 0,
-                "likes": 0, "comments": 0, "shares": 0,
-                "follows": 0, "leads": 0, "opens": 0, "sends": 0,
-            }
+    series = []
+    for date_key in sorted(daily):
         d = daily[date_key]
-        d["impressions"] += r.get("impressions", 0)
-        d["clicks"] += r.get("clicks", 0)
-        d["spend"] += float(r.get("costInLocalCurrency", "0") or "0")
-        d["landing_page_clicks"] += r.get("landingPageClicks", 0)
-        d["conversions"] += r.get("externalWebsiteConversions", 0)
-        d["likes"] += r.get("likes", 0)
-        d["comments"] += r.get("comments", 0)
-        d["shares"] += r.get("shares", 0)
-        d["follows"] += r.get("follows", 0)
-        d["leads"] += r.get("oneClickLeads", 0)
-        d["opens"] += r.get("opens", 0)
-        d["sends"] += r.get("sends", 0)
-
-    result = []
-    for d in sorted(daily.values(), key=lambda x: x["date"]):
-        d["spend"] = round(d["spend"], 2)
+        d["date"] = "%d-%02d-%02d" % date_key
+        d["spend"] = round(d["spend"] / 1_000_000, 2)
         imp, clk = d["impressions"], d["clicks"]
         d["ctr"] = round(clk / imp * 100, 4) if imp else 0
         d["cpc"] = round(d["spend"] / clk, 2) if clk else 0
-        result.append(d)
+        series.append(d)
+    return agg, series
+
+
+def _aggregate_cached(rows: list[dict], cache: dict[int, tuple[dict, list[dict]]]) -> tuple[dict, list[dict]]:
+    """``_aggregate_and_daily`` memoized by list identity.
+
+    The index-map lists live for the whole ``assemble_snapshot`` call, so a
+    campaign or creative listed twice reuses its first reduction.
+    """
+    key = id(rows)
+    result = cache.get(key)
+    if result is None:
+        result = cache[key] = _aggregate_and_daily(rows)
     return result
 
 
@@ -118,18 +159,21 @@ _JOB_FUNCTION_MAP = {
 }
 
 
+# Every resolvable URN keyed in full, so resolution is one dict lookup.
+_LOCAL_URN_TABLE: dict[str, str] = {
+    **{f"urn:li:seniority:{k}": v for k, v in _SENIORITY_MAP.items()},
+    **{f"urn:li:companySizeRange:{k}": v for k, v in _COMPANY_SIZE_MAP.items()},
+    **{f"urn:li:companySize:{k}": v for k, v in _COMPANY_SIZE_MAP.items()},
+    **{f"urn:li:function:{k}": v for k, v in _JOB_FUNCTION_MAP.items()},
+}
+
+
 def _resolve_urn_locally(urn: str) -> str:
-    parts = str(urn).split(":")
-    if len(parts) < 4:
-        return ""
-    entity_type, entity_id = parts[2], parts[3]
-    if entity_type == "seniority":
-        return _SENIORITY_MAP.get(entity_id, "")
-    if entity_type in ("companySizeRange", "companySize"):
-        return _COMPANY_SIZE_MAP.get(entity_id, "")
-    if entity_type == "function":
-        return _JOB_FUNCTION_MAP.get(entity_id, "")
-    return ""
+    return _LOCAL_URN_TABLE.get(str(urn), "")
+
+
+def _row_impressions(r: dict) -> int:
+    return r.get("impressions", 0)
 
 
 def _top_demographics(
@@ -137,10 +181,14 @@ def _top_demographics(
 ) -> list[dict]:
     if urn_names is None:
         urn_names = {}
-    sorted_rows = sorted(demo_rows, key=lambda r: r.get("impressions", 0), reverse=True)
-    total_imp = sum(r.get("impressions", 0) for r in sorted_rows)
+    # nlargest is documented equal to sorted(..., reverse=True)[:n] (ties keep
+    # input order) but only keeps a top_n heap.
+    top_rows = heapq.nlargest(top_n, demo_rows, key=_row_impressions)
+    total_imp = 0
+    for r in demo_rows:
+        total_imp += r.get("impressions", 0)
     result = []
-    for r in sorted_rows[:top_n]:
+    for r in top_rows:
         imp, clk = r.get("impressions", 0), r.get("clicks", 0)
         raw_segment = r.get("pivotValues", ["?"])[0]
         resolved = urn_names.get(raw_segment, "") or _resolve_urn_locally(raw_segment)
@@ -155,18 +203,148 @@ def _top_demographics(
     return result
 
 
+@lru_cache(maxsize=32)
+def _pivot_key(pivot: object) -> str:
+    """Snapshot key for a demographic pivot, e.g. ``MEMBER_SENIORITY`` -> ``seniority``.
+
+    Pivots come from a small fixed enum, so results are cached.
+    """
+    return str(pivot).lower().removeprefix("member_")
+
+
+def _index_demographics(demo_data: object) -> tuple[dict, dict | None]:
+    """Classify ``demo_data`` once, ahead of the per-account loop.
+
+    Returns ``(by_account, shared)``: ``by_account`` maps each top-level key
+    to its ``(pivots, urn_names)`` pair, and ``shared`` is the legacy
+    single-account pivot dict used for accounts with no entry of their own.
+    """
+    if not isinstance(demo_data, dict):
+        return {}, None
+    by_account: dict = {}
+    for key, entry in demo_data.items():
+        pivots, urn_names = None, {}
+        if isinstance(entry, dict) and "pivots" in entry:
+            pivots, urn_names = entry.get("pivots", {}), entry.get("urn_names", {})
+        elif isinstance(entry, dict):
+            pivots = entry
+        by_account[key] = (pivots if isinstance(pivots, dict) else None, urn_names)
+    return by_account, demo_data
+
+
+# Chunk size for batch validation. One validate_python() call per chunk
+# avoids a Python -> pydantic-core round trip per item, while keeping the
+# transient model instances small enough not to churn the cyclic GC (a
+# single whole-list call measured slower than the per-item loop).
+_VALIDATION_CHUNK = 256
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_cls: type) -> TypeAdapter:
+    return TypeAdapter(list[model_cls])  # type: ignore[valid-type]
+
+
 def _validate_list(raw_items: list[dict], model_cls: type, label: str) -> list[dict]:
+    adapter = _list_adapter(model_cls)
     valid: list[dict] = []
-    for raw in raw_items:
+    for i in range(0, len(raw_items), _VALIDATION_CHUNK):
+        chunk = raw_items[i:i + _VALIDATION_CHUNK]
         try:
-            model_cls.model_validate(raw)
-            valid.append(raw)
+            adapter.validate_python(chunk)
+            valid.extend(chunk)
+            continue
         except ValidationError as exc:
-            item_id = raw.get("id", "unknown")
-            logger.warning("Validation failed for %s %s: %d error(s) - skipped", label, item_id, exc.error_count())
+            # Each error's loc starts with the index of the offending item,
+            # so the bad rows are known without re-validating the chunk.
+            bad: dict[int | str, int] = {}
+            for err in exc.errors(include_url=False, include_context=False, include_input=False):
+                idx = err["loc"][0]
+                bad[idx] = bad.get(idx, 0) + 1
+        for idx, raw in enumerate(chunk):
+            n_errors = bad.get(idx)
+            if n_errors is None:
+                valid.append(raw)
+                continue
+            item_id = raw.get("id", "unknown") if isinstance(raw, dict) else "unknown"
+            logger.warning("Validation failed for %s %s: %d error(s) - skipped", label, item_id, n_errors)
     return valid
 
 
+def _campaign_snapshot(
+    camp: dict,
+    camp_metric_map: dict[str, list[dict]],
+    creatives_by_campaign: dict[str, list[dict]],
+    creat_metric_map: dict[str, list[dict]],
+    content_names: dict[str, str],
+    agg_cache: dict[int, tuple[dict, list[dict]]],
+) -> dict:
+    camp_id = str(camp.get("id", ""))
+    camp_urn = f"urn:li:sponsoredCampaign:{camp_id}"
+    budget = camp.get("dailyBudget", {})
+    total_budget = camp.get("totalBudget", {})
+    unit_cost = camp.get("unitCost", {})
+
+    camp_snapshot = {
+        "id": camp.get("id"), "name": camp.get("name"),
+        "status": camp.get("status"), "type": camp.get("type"),
+        "created_at": camp.get("createdAt"),
+        "settings": {
+            "daily_budget": budget.get("amount") if budget else None,
+            "daily_budget_currency": budget.get("currencyCode") if budget else None,
+            "total_budget": total_budget.get("amount") if total_budget else None,
+            "cost_type": camp.get("costType"),
+            "unit_cost": unit_cost.get("amount") if unit_cost else None,
+            "bid_strategy": camp.get("optimizationTargetType"),
+            "creative_selection": camp.get("creativeSelection"),
+            "offsite_delivery_enabled": camp.get("offsiteDeliveryEnabled", False),
+            "audience_expansion_enabled": camp.get("audienceExpansionEnabled", False),
+            "run_schedule": camp.get("runSchedule"),
+            "campaign_group": camp.get("campaignGroup"),
+        },
+        "metrics_summary": {}, "daily_metrics": [], "creatives": [],
+    }
+
+    camp_rows = camp_metric_map.get(camp_id, [])
+    if camp_rows:
+        camp_snapshot["metrics_summary"], camp_snapshot["daily_metrics"] = _aggregate_cached(camp_rows, agg_cache)
+
+    for cr in creatives_by_campaign.get(camp_urn, []):
+        cr_id = cr.get("id", "")
+        cr_ref = cr.get("content", {}).get("reference", "")
+        cr_snapshot = {
+            "id": cr_id, "intended_status": cr.get("intendedStatus"),
+            "is_serving": cr.get("isServing", False),
+            "serving_hold_reasons": cr.get("servingHoldReasons", []),
+            "content_reference": cr_ref,
+            "content_name": content_names.get(cr_ref),
+            "created_at": cr.get("createdAt"), "last_modified_at": cr.get("lastModifiedAt"),
+            "metrics_summary": {}, "daily_metrics": [],
+        }
+        cr_rows = creat_metric_map.get(cr_id, [])
+        if cr_rows:
+            cr_snapshot["metrics_summary"], cr_snapshot["daily_metrics"] = _aggregate_cached(cr_rows, agg_cache)
+        camp_snapshot["creatives"].append(cr_snapshot)
+
+    return camp_snapshot
+
+
+def _account_snapshot(
+    acct: dict, camp_snapshots: list[dict], pivots: dict, urn_names: dict[str, str],
+) -> dict:
+    acct_snapshot = {
+        "id": acct.get("id"), "name": acct.get("name"), "status": acct.get("status"),
+        "currency": acct.get("currency"), "type": acct.get("type"),
+        "test": acct.get("test", False), "created_at": acct.get("createdAt"),
+        "campaigns": camp_snapshots, "audience_demographics": {},
+    }
+    if pivots:
+        for pivot, rows in pivots.items():
+            acct_snapshot["audience_demographics"][_pivot_key(pivot)] = _top_demographics(
+                rows or [], urn_names=urn_names,
+            )
+    return acct_snapshot
+
+
 def assemble_snapshot(
     accounts: list[dict],
     campaigns_list: list[dict],
@@ -177,48 +355,72 @@ def assemble_snapshot(
     date_start: _dt.date,
     date_end: _dt.date,
     content_names: dict[str, str] | None = None,
+    validated: bool = False,
 ) -> dict:
-    accounts = _validate_list(accounts, LinkedInAccount, "account")
-    campaigns_list = _validate_list(campaigns_list, LinkedInCampaign, "campaign")
-    creatives_list = _validate_list(creatives_list, LinkedInCreative, "creative")
-    camp_metrics = _validate_list(camp_metrics, LinkedInAnalyticsRow, "campaign_metric")
-    creat_metrics = _validate_list(creat_metrics, LinkedInAnalyticsRow, "creative_metric")
-
-    validated_demo: dict = {}
-    if isinstance(demo_data, dict):
-        for pivot, rows in demo_data.items():
-            if isinstance(rows, list):
-                validated_demo[pivot] = _validate_list(rows, LinkedInDemographicRow, f"demographic[{pivot}]")
-            else:
-                validated_demo[pivot] = rows
-        demo_data = validated_demo
-
-    camp_metric_map: dict[str, list[dict]] = {}
+    """Build the snapshot dict.
+
+    Pass ``validated=True`` when the inputs already went through
+    ``_validate_list`` (e.g. re-assembling cached payloads) to skip the
+    Pydantic gate. Unvalidated rows are not tolerated on that path: a
+    non-string ``pivotValues`` entry raises.
+    """
+    if not validated:
+        accounts = _validate_list(accounts, LinkedInAccount, "account")
+        campaigns_list = _validate_list(campaigns_list, LinkedInCampaign, "campaign")
+        creatives_list = _validate_list(creatives_list, LinkedInCreative, "creative")
+        camp_metrics = _validate_list(camp_metrics, LinkedInAnalyticsRow, "campaign_metric")
+        creat_metrics = _validate_list(creat_metrics, LinkedInAnalyticsRow, "creative_metric")
+
+        validated_demo: dict = {}
+        if isinstance(demo_data, dict):
+            for pivot, rows in demo_data.items():
+                if isinstance(rows, list):
+                    validated_demo[pivot] = _validate_list(rows, LinkedInDemographicRow, f"demographic[{pivot}]")
+                else:
+                    validated_demo[pivot] = rows
+            demo_data = validated_demo
+
+    # pivotValues are strings here: the gate above enforces it, and callers
+    # passing validated=True must supply _validate_list output. The trailing
+    # URN id is therefore sliced directly (rfind() == -1 keeps the whole
+    # value). The index maps are defaultdicts for the build; lookups below use
+    # .get() so misses never insert empty buckets.
+    camp_metric_map: defaultdict[str, list[dict]] = defaultdict(list)
     for r in camp_metrics:
         for pv in r.get("pivotValues", []):
-            cid = _extract_id_from_urn(pv)
-            camp_metric_map.setdefault(cid, []).append(r)
+            cid = pv[pv.rfind(":") + 1:]
+            camp_metric_map[cid].append(r)
 
-    creat_metric_map: dict[str, list[dict]] = {}
+    creat_metric_map: defaultdict[str, list[dict]] = defaultdict(list)
     for r in creat_metrics:
         for pv in r.get("pivotValues", []):
-            if "sponsoredCreative" in str(pv):
-                creat_metric_map.setdefault(pv, []).append(r)
+            if "sponsoredCreative" in pv:
+                creat_metric_map[pv].append(r)
 
-    creatives_by_campaign: dict[str, list[dict]] = {}
+    creatives_by_campaign: defaultdict[str, list[dict]] = defaultdict(list)
     for cr in creatives_list:
         camp_urn = cr.get("campaign", "")
-        creatives_by_campaign.setdefault(camp_urn, []).append(cr)
+        creatives_by_campaign[camp_urn].append(cr)
 
-    campaigns_by_account: dict[int, list[dict]] = {}
+    campaigns_by_account: defaultdict[int, list[dict]] = defaultdict(list)
     for camp in campaigns_list:
         acct_id = camp.get("_account_id")
-        if acct_id is not None:
+        # Tags are ints straight from the fetcher. Anything else (strings
+        # from cached JSON, floats) is bucketed if int() accepts it;
+        # otherwise the campaign is untagged.
+        if isinstance(acct_id, int):
+            campaigns_by_account[acct_id].append(camp)
+        elif acct_id is not None:
             try:
-                campaigns_by_account.setdefault(int(acct_id), []).append(camp)
+                campaigns_by_account[int(acct_id)].append(camp)
             except (ValueError, TypeError):
                 pass
 
+    demo_by_acct, shared_demo = _index_demographics(demo_data)
+    content_names = content_names or {}
+    legacy_campaigns: list[dict] | None = None
+    agg_cache: dict[int, tuple[dict, list[dict]]] = {}
+
     snapshot: dict = {
         "generated_at": datetime.now(tz=timezone.utc).isoformat(),
         "date_range": {"start": str(date_start), "end": str(date_end), "days": (date_end - date_start).days},
@@ -226,98 +428,44 @@ def assemble_snapshot(
     }
 
     for acct in accounts:
-        acct_snapshot = {
-            "id": acct.get("id"), "name": acct.get("name"), "status": acct.get("status"),
-            "currency": acct.get("currency"), "type": acct.get("type"),
-            "test": acct.get("test", False), "created_at": acct.get("createdAt"),
-            "campaigns": [], "audience_demographics": {},
-        }
         acct_id = acct.get("id")
         acct_campaigns = campaigns_by_account.get(acct_id) if acct_id is not None else None
-        if acct_campaigns is None:
-            acct_campaigns = campaigns_list
-
-        for camp in acct_campaigns:
-            camp_id = str(camp.get("id", ""))
-            camp_urn = f"urn:li:sponsoredCampaign:{camp_id}"
-            budget = camp.get("dailyBudget", {})
-            total_budget = camp.get("totalBudget", {})
-            unit_cost = camp.get("unitCost", {})
-
-            camp_snapshot = {
-                "id": camp.get("id"), "name": camp.get("name"),
-                "status": camp.get("status"), "type": camp.get("type"),
-                "created_at": camp.get("createdAt"),
-                "settings": {
-                    "daily_budget": budget.get("amount") if budget else None,
-                    "daily_budget_currency": budget.get("currencyCode") if budget else None,
-                    "total_budget": total_budget.get("amount") if total_budget else None,
-                    "cost_type": camp.get("costType"),
-                    "unit_cost": unit_cost.get("amount") if unit_cost else None,
-                    "bid_strategy": camp.get("optimizationTargetType"),
-                    "creative_selection": camp.get("creativeSelection"),
-                    "offsite_delivery_enabled": camp.get("offsiteDeliveryEnabled", False),
-                    "audience_expansion_enabled": camp.get("audienceExpansionEnabled", False),
-                    "run_schedule": camp.get("runSchedule"),
-                    "campaign_group": camp.get("campaignGroup"),
-                },
-                "metrics_summary": {}, "daily_metrics": [], "creatives": [],
-            }
 
-            camp_rows = camp_metric_map.get(camp_id, [])
-            if camp_rows:
-                camp_snapshot["metrics_summary"] = _aggregate_metrics(camp_rows)
-                camp_snapshot["daily_metrics"] = _daily_time_series(camp_rows)
-
-            content_names = content_names or {}
-            for cr in creatives_by_campaign.get(camp_urn, []):
-                cr_id = cr.get("id", "")
-                cr_ref = cr.get("content", {}).get("reference", "")
-                cr_snapshot = {
-                    "id": cr_id, "intended_status": cr.get("intendedStatus"),
-                    "is_serving": cr.get("isServing", False),
-                    "serving_hold_reasons": cr.get("servingHoldReasons", []),
-                    "content_reference": cr_ref,
-                    "content_name": content_names.get(cr_ref),
-                    "created_at": cr.get("createdAt"), "last_modified_at": cr.get("lastModifiedAt"),
-                    "metrics_summary": {}, "daily_metrics": [],
-                }
-                cr_rows = creat_metric_map.get(cr_id, [])
-                if cr_rows:
-                    cr_snapshot["metrics_summary"] = _aggregate_metrics(cr_rows)
-                    cr_snapshot["daily_metrics"] = _daily_time_series(cr_rows)
-                camp_snapshot["creatives"].append(cr_snapshot)
-
-            acct_snapshot["campaigns"].append(camp_snapshot)
-
-        acct_demo_raw = None
-        urn_names: dict[str, str] = {}
-        if isinstance(demo_data, dict) and acct_id in demo_data:
-            entry = demo_data.get(acct_id, {})
-            if isinstance(entry, dict) and "pivots" in entry:
-                acct_demo_raw = entry.get("pivots", {})
-                urn_names = entry.get("urn_names", {})
-            elif isinstance(entry, dict):
-                acct_demo_raw = entry
-        elif isinstance(demo_data, dict):
-            acct_demo_raw = demo_data
-
-        if isinstance(acct_demo_raw, dict):
-            for pivot, rows in acct_demo_raw.items():
-                key = str(pivot).lower().replace("member_", "")
-                acct_snapshot["audience_demographics"][key] = _top_demographics(rows or [], urn_names=urn_names)
-
-        snapshot["accounts"].append(acct_snapshot)
+        if acct_campaigns is None:
+            # Untagged (legacy) payloads give every such account the full
+            # campaign list: build those subtrees once and hand each account
+            # its own shallow copies.
+            if legacy_campaigns is None:
+                legacy_campaigns = [
+                    _campaign_snapshot(camp, camp_metric_map, creatives_by_campaign, creat_metric_map, content_names, agg_cache)
+                    for camp in campaigns_list
+                ]
+            camp_snapshots = [copy.copy(c) for c in legacy_campaigns]
+        else:
+            camp_snapshots = [
+                _campaign_snapshot(camp, camp_metric_map, creatives_by_campaign, creat_metric_map, content_names, agg_cache)
+                for camp in acct_campaigns
+            ]
+
+        pivots, urn_names = demo_by_acct.get(acct_id) or (shared_demo, {})
+        snapshot["accounts"].append(_account_snapshot(acct, camp_snapshots, pivots, urn_names))
 
     return snapshot
 
 
-def save_snapshot_json(snap: dict, path: Path | None = None) -> Path:
+def save_snapshot_json(snap: dict, path: Path | None = None, pretty: bool = False) -> Path:
     if path is None:
         ts = datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         snapshots_dir = Path("data/snapshots")
         snapshots_dir.mkdir(parents=True, exist_ok=True)
         path = snapshots_dir / f"snapshot_{ts}.json"
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(snap, indent=2, default=str))
+    with path.open("w", encoding="utf-8") as fp:
+        if pretty:
+            # Indented output only has a pure-Python encoder; stream its chunks
+            # rather than building the whole document in memory.
+            json.dump(snap, fp, indent=2, default=str)
+        else:
+            # Compact one-shot dumps() runs in the C encoder, ~10x faster.
+            fp.write(json.dumps(snap, separators=(",", ":"), default=str))
     return path
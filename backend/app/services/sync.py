@@ -7,11 +7,8 @@ from datetime import date, timedelta
 from typing import Any
 
 from app.core.security import AuthManager
-from app.crud.accounts import upsert_account
-from app.crud.campaigns import upsert_campaign
-from app.crud.demographics import upsert_demographics
-from app.crud.metrics import upsert_campaign_daily_metrics, upsert_creative_daily_metrics, upsert_creatives
-from app.crud.sync_log import finish_sync_run, start_sync_run
+from app.crud.snapshot import persist_snapshot, snapshot_digest
+from app.crud.sync_log import finish_sync_run, last_snapshot_hash, start_sync_run
 from app.linkedin.client import LinkedInClient
 from app.linkedin.fetchers import fetch_ad_accounts, fetch_campaigns, fetch_creatives, resolve_content_references
 from app.linkedin.metrics import (
@@ -55,7 +52,8 @@ def create_job(job_id: str) -> SyncJob:
 async def run_sync(job: SyncJob, get_session_fn: Any) -> None:
     """Run the full sync pipeline, emitting progress events."""
     sync_run_id: int | None = None
-    sync_session = None
+    session_gen = None
+    session = None
     try:
         auth = AuthManager()
         if not auth.is_authenticated():
@@ -74,10 +72,11 @@ async def run_sync(job: SyncJob, get_session_fn: Any) -> None:
             job.status = "completed"
             return
 
+        # One session serves the sync_log bookkeeping and the persist step.
+        session_gen = get_session_fn()
+        session = next(session_gen)
         # Start sync_log entry (use "all" for multi-account sync)
-        sync_session_gen = get_session_fn()
-        sync_session = next(sync_session_gen)
-        sync_run_id = start_sync_run(sync_session, "all", trigger="manual")
+        sync_run_id = start_sync_run(session, "all", trigger="manual")
 
         all_campaigns: list[dict] = []
         all_creatives: list[dict] = []
@@ -113,7 +112,10 @@ async def run_sync(job: SyncJob, get_session_fn: Any) -> None:
         job.emit("4-6/6", f"{len(camp_metrics)} campaign metrics, {len(creat_metrics)} creative metrics.")
 
         job.emit("assemble", "Assembling snapshot...")
-        snapshot = assemble_snapshot(
+        # Assembly is CPU-bound pure Python; run it off the event loop so SSE
+        # streams and other requests keep being served meanwhile.
+        snapshot = await asyncio.to_thread(
+            assemble_snapshot,
             accounts, all_campaigns, all_creatives,
             camp_metrics, creat_metrics, demographics,
             date_start, today,
@@ -123,44 +125,35 @@ async def run_sync(job: SyncJob, get_session_fn: Any) -> None:
         json_path = save_snapshot_json(snapshot)
         job.emit("persist", f"JSON saved to {json_path}")
 
-        # Persist to database
-        job.emit("persist", "Updating database...")
-        session_gen = get_session_fn()
-        session = next(session_gen)
-        try:
-            for acct in snapshot.get("accounts", []):
-                upsert_account(session, acct)
-                for camp in acct.get("campaigns", []):
-                    upsert_campaign(session, acct["id"], camp)
-                    upsert_campaign_daily_metrics(session, camp)
-                    upsert_creatives(session, acct["id"], camp)
-                    for cr in camp.get("creatives", []):
-                        upsert_creative_daily_metrics(session, cr)
-                upsert_demographics(session, acct, snapshot.get("date_range", {}))
-            session.commit()
-        finally:
-            try:
-                next(session_gen)
-            except StopIteration:
-                pass
+        # Persist to database, unless the content matches the last successful run
+        digest = snapshot_digest(snapshot)
+        skipped = digest == last_snapshot_hash(session, "all")
+        if skipped:
+            job.emit("persist", "Snapshot unchanged since last sync, skipping database write.")
+        else:
+            job.emit("persist", "Updating database...")
+            persist_snapshot(session, snapshot)
 
         # Record success in sync_log
-        if sync_run_id and sync_session:
-            finish_sync_run(sync_session, sync_run_id, status="success", stats={
+        if sync_run_id and session:
+            finish_sync_run(session, sync_run_id, status="success", stats={
                 "campaigns_fetched": len(all_campaigns),
                 "creatives_fetched": len(all_creatives),
+                "snapshot_hash": digest,
             })
 
-        job.emit("persist", "Database updated.")
+        if not skipped:
+            job.emit("persist", "Database updated.")
         job.status = "completed"
         job.result = {"json_path": str(json_path), "account_count": len(accounts)}
         job.emit("done", "Sync complete!")
 
     except Exception as exc:
         # Record failure in sync_log
-        if sync_run_id and sync_session:
+        if sync_run_id and session:
             try:
-                finish_sync_run(sync_session, sync_run_id, status="failed", stats={
+                session.rollback()
+                finish_sync_run(session, sync_run_id, status="failed", stats={
                     "errors": str(exc),
                 })
             except Exception:
@@ -170,3 +163,6 @@ async def run_sync(job: SyncJob, get_session_fn: Any) -> None:
         job.error = str(exc)
         job.emit("error", str(exc))
         logger.error("Sync failed: %s", exc, exc_info=True)
+    finally:
+        if session_gen is not None:
+            session_gen.close()
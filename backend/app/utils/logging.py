@@ -20,8 +20,12 @@ from __future__ import annotations
 import logging
 import logging.config
 import os
+import threading
+import time
 import uuid
+import weakref
 from contextvars import ContextVar
+from functools import lru_cache
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
 from typing import Optional
@@ -39,19 +43,7 @@ request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
 # Paths
 # ---------------------------------------------------------------------------
 LOGS_DIR = Path(os.getenv("LOGS_DIR", "logs"))
-LOGS_DIR.mkdir(exist_ok=True)
-
-# ---------------------------------------------------------------------------
-# Install rich tracebacks globally
-# ---------------------------------------------------------------------------
-install_rich_traceback(
-    show_locals=True,
-    suppress=["uvicorn", "starlette", "fastapi"],
-)
-
-# Rich console for RichHandler
-_console = Console(stderr=True, force_terminal=True)
-
+LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
 # ---------------------------------------------------------------------------
 # Context filter — injects request_id into every log record
@@ -82,6 +74,65 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_entry)
 
 
+# ---------------------------------------------------------------------------
+# Buffered file handlers
+# ---------------------------------------------------------------------------
+_LOG_BUFFER_SIZE = 64 * 1024
+_LOG_FLUSH_INTERVAL = 5.0  # seconds
+
+
+class BufferedTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """Daily-rotated file handler that batches writes.
+
+    ``StreamHandler.emit`` flushes after every record, so bursts of API/sync
+    logging become one ``write()`` syscall each. Here records sit in a 64 KiB
+    file buffer that is written when full, on ERROR+ records, every
+    ``_LOG_FLUSH_INTERVAL`` seconds, on rollover and at shutdown.
+    """
+
+    def _open(self):
+        return self._builtin_open(
+            self.baseFilename, self.mode,
+            buffering=_LOG_BUFFER_SIZE, encoding=self.encoding, errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            self.flush_buffer()
+
+    def flush(self) -> None:
+        # Called per record by StreamHandler.emit; the buffer is written by
+        # flush_buffer() instead.
+        pass
+
+    def flush_buffer(self) -> None:
+        super().flush()
+
+    def close(self) -> None:
+        self.flush_buffer()
+        super().close()
+
+
+_buffered_handlers: weakref.WeakSet[BufferedTimedRotatingFileHandler] = weakref.WeakSet()
+_flusher_started = False
+
+
+def _flush_loop() -> None:
+    while True:
+        time.sleep(_LOG_FLUSH_INTERVAL)
+        for handler in list(_buffered_handlers):
+            handler.flush_buffer()
+
+
+def _register_buffered(handler: BufferedTimedRotatingFileHandler) -> None:
+    global _flusher_started
+    _buffered_handlers.add(handler)
+    if not _flusher_started:
+        _flusher_started = True
+        threading.Thread(target=_flush_loop, name="log-flusher", daemon=True).start()
+
+
 # ---------------------------------------------------------------------------
 # Configure logging once at import time
 # ---------------------------------------------------------------------------
@@ -95,18 +146,29 @@ def setup_logging(log_level: str = "INFO") -> None:
         return
     _configured = True
 
+    # Rendering every frame's locals is slow and allocation-heavy; opt in with
+    # LOG_TRACEBACK_LOCALS=1 when debugging.
+    show_locals = os.getenv("LOG_TRACEBACK_LOCALS", "0") == "1"
+    install_rich_traceback(
+        show_locals=show_locals,
+        suppress=["uvicorn", "starlette", "fastapi"],
+        max_frames=20,
+    )
+
     level = getattr(logging, log_level.upper(), logging.INFO)
     ctx_filter = ContextFilter()
 
     # -- Console handler (Rich) -------------------------------------------
     console_handler = RichHandler(
-        console=_console,
+        # Let rich detect the terminal: redirected/captured stderr gets plain
+        # text instead of rendered ANSI (set FORCE_COLOR to override).
+        console=Console(stderr=True),
         show_time=True,
         show_level=True,
         show_path=True,
         markup=True,
         rich_tracebacks=True,
-        tracebacks_show_locals=True,
+        tracebacks_show_locals=show_locals,
         tracebacks_suppress=["uvicorn", "starlette", "fastapi"],
     )
     console_handler.setLevel(level)
@@ -114,7 +176,7 @@ def setup_logging(log_level: str = "INFO") -> None:
     console_handler.addFilter(ctx_filter)
 
     # -- App log file (daily rotation, 30 days) ---------------------------
-    app_handler = TimedRotatingFileHandler(
+    app_handler = BufferedTimedRotatingFileHandler(
         LOGS_DIR / "app.log",
         when="midnight",
         backupCount=30,
@@ -146,7 +208,7 @@ def setup_logging(log_level: str = "INFO") -> None:
     error_handler.addFilter(ctx_filter)
 
     # -- JSON log file (daily rotation) -----------------------------------
-    json_handler = TimedRotatingFileHandler(
+    json_handler = BufferedTimedRotatingFileHandler(
         LOGS_DIR / "app.json.log",
         when="midnight",
         backupCount=30,
@@ -157,7 +219,7 @@ def setup_logging(log_level: str = "INFO") -> None:
     json_handler.addFilter(ctx_filter)
 
     # -- API access log file (daily rotation) -----------------------------
-    api_handler = TimedRotatingFileHandler(
+    api_handler = BufferedTimedRotatingFileHandler(
         LOGS_DIR / "api.log",
         when="midnight",
         backupCount=30,
@@ -172,6 +234,9 @@ def setup_logging(log_level: str = "INFO") -> None:
     )
     api_handler.addFilter(ctx_filter)
 
+    for handler in (app_handler, json_handler, api_handler):
+        _register_buffered(handler)
+
     # -- Root app logger --------------------------------------------------
     app_logger = logging.getLogger("app")
     app_logger.setLevel(logging.DEBUG)
@@ -218,37 +283,39 @@ def generate_request_id() -> str:
 # ---------------------------------------------------------------------------
 # Domain-specific helpers
 # ---------------------------------------------------------------------------
-_api_logger = None
-
-
-def _get_api_logger() -> logging.Logger:
-    global _api_logger
-    if _api_logger is None:
-        _api_logger = get_logger("app.api.access")
-    return _api_logger
+@lru_cache(maxsize=None)
+def _helper_logger(name: str) -> logging.Logger:
+    return get_logger(name)
 
 
 def log_api_call(
     method: str, endpoint: str, status_code: int, duration: float,
 ) -> None:
     """Log an API call with structured information."""
+    logger = _helper_logger("app.api.access")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     status = "OK" if 200 <= status_code < 300 else "FAIL"
-    _get_api_logger().info(
-        "%s %s %s -> %d (%.2fs)", status, method, endpoint, status_code, duration,
-    )
+    logger.info("%s %s %s -> %d (%.2fs)", status, method, endpoint, status_code, duration)
 
 
 def log_sync_progress(step: str, count: int, total: Optional[int] = None) -> None:
     """Log data sync progress."""
-    logger = get_logger("app.services.sync")
-    progress = f"[{count}/{total}]" if total else f"[{count}]"
-    logger.info("SYNC %s %s", step, progress)
+    logger = _helper_logger("app.services.sync")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    if total:
+        logger.info("SYNC %s [%d/%d]", step, count, total)
+    else:
+        logger.info("SYNC %s [%d]", step, count)
 
 
 def log_auth_event(event: str, details: Optional[str] = None) -> None:
     """Log authentication-related events."""
-    logger = get_logger("app.core.security")
-    msg = f"AUTH: {event}"
+    logger = _helper_logger("app.core.security")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     if details:
-        msg += f" - {details}"
-    logger.info(msg)
+        logger.info("AUTH: %s - %s", event, details)
+    else:
+        logger.info("AUTH: %s", event)
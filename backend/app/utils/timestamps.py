@@ -0,0 +1,17 @@
+"""Timestamp rendering for API responses.
+
+Timestamps are stored as integer epoch seconds; responses expose them as
+ISO-8601 UTC strings.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+
+def iso_fetched_at(row: dict) -> dict:
+    """Render ``row["fetched_at"]`` (epoch seconds) as ISO-8601 UTC in place."""
+    value = row.get("fetched_at")
+    if value is not None:
+        row["fetched_at"] = datetime.fromtimestamp(value, tz=timezone.utc).isoformat()
+    return row
@@ -1,5 +1,7 @@
 """Pytest configuration: SQLite in-memory + FastAPI TestClient."""
 
+import json
+import logging
 import time
 
 import pytest
@@ -11,9 +13,28 @@ from app.core.deps import get_db
 from app.main import app
 from app.models import *  # noqa: F401, F403 — import all models for table creation
 
+_FILE_LOGGERS = ("app", "app.api.access", "uvicorn", "uvicorn.error", "uvicorn.access")
 
-@pytest.fixture(name="engine")
-def engine_fixture():
+
+@pytest.fixture(autouse=True)
+def _mute_file_logs():
+    """Detach the log file handlers so tests never write to ``LOGS_DIR``."""
+    detached = []
+    for name in _FILE_LOGGERS:
+        logger = logging.getLogger(name)
+        for handler in logger.handlers:
+            if isinstance(handler, logging.FileHandler):
+                detached.append((logger, handler))
+    for logger, handler in detached:
+        logger.removeHandler(handler)
+    yield
+    for logger, handler in detached:
+        logger.addHandler(handler)
+
+
+@pytest.fixture(scope="session")
+def _schema_engine():
+    """In-memory database whose schema is created once per session."""
     engine = create_engine(
         "sqlite://",
         connect_args={"check_same_thread": False},
@@ -24,6 +45,15 @@ def engine_fixture():
     SQLModel.metadata.drop_all(engine)
 
 
+@pytest.fixture(name="engine")
+def engine_fixture(_schema_engine):
+    yield _schema_engine
+    # Empty the tables (children first) rather than rebuilding the schema.
+    with _schema_engine.begin() as conn:
+        for table in reversed(SQLModel.metadata.sorted_tables):
+            conn.execute(table.delete())
+
+
 @pytest.fixture(name="session")
 def session_fixture(engine):
     with Session(engine) as session:
@@ -42,7 +72,7 @@ def client_fixture(engine):
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_tokens():
     now = int(time.time())
     return {
@@ -54,3 +84,11 @@ def mock_tokens():
         "refresh_token_expires_at": now + 31536000,
         "saved_at": now,
     }
+
+
+@pytest.fixture(scope="session")
+def canonical_tokens_file(tmp_path_factory, mock_tokens):
+    """``mock_tokens`` serialized once per session. Read-only: copy it before writing."""
+    path = tmp_path_factory.mktemp("tokens") / "tokens.json"
+    path.write_text(json.dumps(mock_tokens))
+    return path
@@ -1,62 +1,87 @@
 """Tests for AuthManager (async httpx)."""
 
-import json
+import shutil
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from app.core.security import AuthManager
+from app.core.config import settings
+from app.core.security import AuthManager, _authorization_url
 from app.errors.exceptions import AuthenticationError
 
 
+def _use_test_settings(mp: pytest.MonkeyPatch, tokens_file) -> None:
+    mp.setattr(settings, "LINKEDIN_CLIENT_ID", "test_id")
+    mp.setattr(settings, "LINKEDIN_CLIENT_SECRET", "test_secret")
+    mp.setattr(settings, "LINKEDIN_REDIRECT_URI", "http://localhost:8000/callback")
+    mp.setattr(settings, "OAUTH_STATE", "teststate")
+    mp.setattr(settings, "tokens_file", tokens_file)
+
+
+@pytest.fixture
+def tokens_file(tmp_path, monkeypatch):
+    """Point settings at a per-test tokens path (not created)."""
+    path = tmp_path / "tokens.json"
+    _use_test_settings(monkeypatch, path)
+    return path
+
+
+@pytest.fixture(scope="module")
+def authenticated_auth(canonical_tokens_file):
+    """Authenticated manager shared by tests that only read token state."""
+    with pytest.MonkeyPatch.context() as mp:
+        _use_test_settings(mp, canonical_tokens_file)
+        yield AuthManager()
+
+
 @pytest.fixture
-def auth_manager(tmp_path, mock_tokens):
-    tokens_file = tmp_path / "tokens.json"
-    tokens_file.write_text(json.dumps(mock_tokens))
+def auth_manager(tokens_file, canonical_tokens_file):
+    """Fresh manager for tests that modify or persist tokens."""
+    # A real copy, not a hardlink: _save_tokens rewrites the file in place.
+    shutil.copyfile(canonical_tokens_file, tokens_file)
+    return AuthManager()
 
-    with patch("app.core.security.settings") as mock_settings:
-        mock_settings.LINKEDIN_CLIENT_ID = "test_id"
-        mock_settings.LINKEDIN_CLIENT_SECRET = "test_secret"
-        mock_settings.LINKEDIN_REDIRECT_URI = "http://localhost:8000/callback"
-        mock_settings.OAUTH_STATE = "teststate"
-        mock_settings.tokens_file = tokens_file
 
-        mgr = AuthManager()
-        mgr.tokens = mock_tokens
-        mgr.tokens_file = tokens_file
-        yield mgr
+def test_is_authenticated(authenticated_auth):
+    assert authenticated_auth.is_authenticated() is True
 
 
-def test_is_authenticated(auth_manager):
-    assert auth_manager.is_authenticated() is True
+def test_not_authenticated_no_tokens(tokens_file):
+    assert AuthManager().is_authenticated() is False
 
 
-def test_not_authenticated_no_tokens(tmp_path):
-    with patch("app.core.security.settings") as mock_settings:
-        mock_settings.LINKEDIN_CLIENT_ID = "test"
-        mock_settings.LINKEDIN_CLIENT_SECRET = "test"
-        mock_settings.LINKEDIN_REDIRECT_URI = "http://localhost:8000/callback"
-        mock_settings.OAUTH_STATE = "teststate"
-        mock_settings.tokens_file = tmp_path / "nonexistent.json"
+def test_save_and_reload_tokens(auth_manager):
+    auth_manager.tokens["access_token"] = "rotated"
+    auth_manager._save_tokens()
 
-        mgr = AuthManager()
-        assert mgr.is_authenticated() is False
+    reloaded = AuthManager()
+    assert reloaded.tokens["access_token"] == "rotated"
+    assert reloaded.tokens["saved_at"] == auth_manager.tokens["saved_at"]
 
 
-def test_token_status(auth_manager):
-    status = auth_manager.token_status()
+def test_token_status(authenticated_auth):
+    status = authenticated_auth.token_status()
     assert status["authenticated"] is True
     assert status["access_token_days_remaining"] > 0
 
 
-def test_get_authorization_url(auth_manager):
-    url = auth_manager.get_authorization_url()
-    assert "linkedin.com/oauth/v2/authorization" in url
-    assert "client_id=" in url
+def test_get_authorization_url(authenticated_auth):
+    url = authenticated_auth.get_authorization_url()
+    assert all(part in url for part in (
+        "linkedin.com/oauth/v2/authorization", "response_type=code", "client_id=", "redirect_uri=",
+    )), url
+
+
+def test_authorization_url_shared_across_instances(authenticated_auth):
+    url = authenticated_auth.get_authorization_url()
+    hits = _authorization_url.cache_info().hits
+
+    assert AuthManager().get_authorization_url() == url
+    assert _authorization_url.cache_info().hits == hits + 1
 
 
 @pytest.mark.asyncio
-async def test_exchange_code_raises_on_failure(auth_manager):
+async def test_exchange_code_raises_on_failure(authenticated_auth):
     mock_resp = AsyncMock()
     mock_resp.status_code = 400
     mock_resp.text = "Bad Request"
@@ -69,4 +94,4 @@ async def test_exchange_code_raises_on_failure(auth_manager):
         mock_client_cls.return_value = mock_client
 
         with pytest.raises(AuthenticationError):
-            await auth_manager.exchange_code_for_token("bad_code")
+            await authenticated_auth.exchange_code_for_token("bad_code")
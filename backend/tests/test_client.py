@@ -1,6 +1,7 @@
 """Tests for LinkedIn API client (async httpx)."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -8,25 +9,40 @@ from app.errors.exceptions import LinkedInAPIError, RateLimitError
 from app.linkedin.client import LinkedInClient
 
 
-@pytest.fixture
+def fake_response(payload=None, status_code=200, headers=None, reason_phrase="OK", text=""):
+    """Plain stand-in for ``httpx.Response`` with just the attributes the client reads."""
+    return SimpleNamespace(
+        is_success=200 <= status_code < 300,
+        status_code=status_code,
+        reason_phrase=reason_phrase,
+        headers=headers or {},
+        text=text,
+        json=lambda: payload,
+    )
+
+
+def url_of(mock_call):
+    """URL positional argument of the most recent call to a mocked ``get``."""
+    return mock_call.call_args[0][0]
+
+
+@pytest.fixture(scope="module")
 def mock_auth():
     auth = AsyncMock()
     auth.get_access_token = AsyncMock(return_value="mock_token")
     return auth
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def linkedin_client(mock_auth):
+    """One client for the module: it holds no per-request state, and each test
+    patches ``httpx.AsyncClient`` itself."""
     return LinkedInClient(mock_auth)
 
 
 @pytest.mark.asyncio
 async def test_get_success(linkedin_client):
-    mock_resp = MagicMock()
-    mock_resp.is_success = True
-    mock_resp.status_code = 200
-    mock_resp.json.return_value = {"elements": [{"id": 1}]}
-    mock_resp.headers = {"content-type": "application/json"}
+    mock_resp = fake_response({"elements": [{"id": 1}]}, headers={"content-type": "application/json"})
 
     with patch("app.linkedin.client.httpx.AsyncClient") as mock_cls:
         mock_client = AsyncMock()
@@ -41,11 +57,7 @@ async def test_get_success(linkedin_client):
 
 @pytest.mark.asyncio
 async def test_get_rate_limit(linkedin_client):
-    mock_resp = MagicMock()
-    mock_resp.is_success = False
-    mock_resp.status_code = 429
-    mock_resp.reason_phrase = "Too Many Requests"
-    mock_resp.headers = {"Retry-After": "60"}
+    mock_resp = fake_response(status_code=429, reason_phrase="Too Many Requests", headers={"Retry-After": "60"})
 
     with patch("app.linkedin.client.httpx.AsyncClient") as mock_cls:
         mock_client = AsyncMock()
@@ -54,19 +66,17 @@ async def test_get_rate_limit(linkedin_client):
         mock_client.get = AsyncMock(return_value=mock_resp)
         mock_cls.return_value = mock_client
 
-        with pytest.raises(RateLimitError):
+        with pytest.raises(RateLimitError) as exc_info:
             await linkedin_client.get("/test")
+        assert exc_info.value.retry_after == 60
 
 
 @pytest.mark.asyncio
 async def test_get_api_error(linkedin_client):
-    mock_resp = MagicMock()
-    mock_resp.is_success = False
-    mock_resp.status_code = 500
-    mock_resp.reason_phrase = "Internal Server Error"
-    mock_resp.headers = {"content-type": "application/json"}
-    mock_resp.json.return_value = {"message": "error"}
-    mock_resp.text = "error"
+    mock_resp = fake_response(
+        {"message": "error"}, status_code=500, reason_phrase="Internal Server Error",
+        headers={"content-type": "application/json"}, text="error",
+    )
 
     with patch("app.linkedin.client.httpx.AsyncClient") as mock_cls:
         mock_client = AsyncMock()
@@ -75,5 +85,27 @@ async def test_get_api_error(linkedin_client):
         mock_client.get = AsyncMock(return_value=mock_resp)
         mock_cls.return_value = mock_client
 
-        with pytest.raises(LinkedInAPIError):
+        with pytest.raises(LinkedInAPIError) as exc_info:
             await linkedin_client.get("/test")
+        assert exc_info.value.response_data == {"message": "error"}
+
+
+@pytest.mark.asyncio
+async def test_get_all_pages_follows_page_token(linkedin_client):
+    pages = [
+        fake_response({"elements": [{"id": 1}], "metadata": {"nextPageToken": "token123"}}),
+        fake_response({"elements": [{"id": 2}], "metadata": {}}),
+    ]
+
+    with patch("app.linkedin.client.httpx.AsyncClient") as mock_cls:
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=False)
+        mock_client.get = AsyncMock(side_effect=pages)
+        mock_cls.return_value = mock_client
+
+        items = await linkedin_client.get_all_pages("/adCampaigns", "q=search&status=ACTIVE")
+
+    assert items == [{"id": 1}, {"id": 2}]
+    second_url = url_of(mock_client.get)
+    assert all(part in second_url for part in ("status=ACTIVE", "pageToken=token123", "count=100")), second_url
@@ -1,14 +1,32 @@
 """Tests for CRUD operations using SQLite in-memory."""
 
+import time
+
+from sqlalchemy import event, text
 from sqlmodel import Session
 
+from app.core.config import settings
 from app.crud.accounts import get_accounts, upsert_account
 from app.crud.campaigns import get_campaigns, upsert_campaign
+from app.crud.demographics import get_demographics
 from app.crud.metrics import (
     get_campaign_metrics_paginated,
+    get_creative_metrics_paginated,
+    get_creatives,
     upsert_campaign_daily_metrics,
+    upsert_creatives,
+)
+from app.crud.snapshot import persist_snapshot, persist_snapshots, snapshot_digest
+from app.crud.sync_log import (
+    _ACTIVE_AUDIT_SQL,
+    _LAST_SUCCESS_SQL,
+    active_campaign_audit,
+    finish_sync_run,
+    last_snapshot_hash,
+    should_sync,
+    start_sync_run,
+    table_counts,
 )
-from app.crud.sync_log import finish_sync_run, should_sync, start_sync_run
 
 
 def test_upsert_and_get_accounts(session: Session):
@@ -48,6 +66,9 @@ def test_upsert_campaign(session: Session):
     assert len(campaigns) == 1
     assert campaigns[0]["name"] == "Test Campaign"
     assert campaigns[0]["account_name"] == "Acct"
+    assert campaigns[0]["daily_budget"] == 50.0
+    # Absent amounts are stored as NULL rather than a fabricated 0.0
+    assert campaigns[0]["total_budget"] is None
 
 
 def test_upsert_campaign_daily_metrics(session: Session):
@@ -71,6 +92,95 @@ def test_upsert_campaign_daily_metrics(session: Session):
     assert len(result["rows"]) == 2
 
 
+def _make_snapshot(**campaign) -> dict:
+    """Build a fresh one-account, one-campaign snapshot; keyword args override campaign fields."""
+    return {
+        "date_range": {"start": "2026-01-01", "end": "2026-01-02"},
+        "accounts": [{
+            "id": 100, "name": "Acct", "status": "ACTIVE",
+            "campaigns": [{"id": 1, "name": "Camp", "status": "ACTIVE", "settings": {}, **campaign}],
+        }],
+    }
+
+
+def test_persist_snapshot(session: Session):
+    creative = {
+        "id": "urn:li:sponsoredCreative:9",
+        "serving_hold_reasons": ["UNDER_REVIEW"],
+        "daily_metrics": [
+            {"date": "2026-01-01", "impressions": 400, "clicks": 8, "spend": 4.0},
+            {"date": "2026-01-02", "impressions": 500, "clicks": 9, "spend": 5.0},
+        ],
+    }
+    snapshot = _make_snapshot(
+        daily_metrics=[
+            {"date": "2026-01-01", "impressions": 1000, "clicks": 50, "spend": 25.0},
+            {"date": "2026-01-02", "impressions": 1200, "clicks": 60, "spend": 30.0},
+        ],
+        creatives=[creative],
+    )
+    snapshot["accounts"][0]["audience_demographics"] = {
+        "job_title": [
+            {"segment": "Engineer", "impressions": 700, "share_of_impressions": 70.0},
+            {"segment": "Designer", "impressions": 300, "share_of_impressions": 30.0},
+        ],
+    }
+    persist_snapshot(session, snapshot)
+    # Re-persisting the same snapshot updates rows in place, also when both
+    # copies go through one batched transaction.
+    persist_snapshot(session, snapshot)
+    persist_snapshots(session, [snapshot, snapshot])
+
+    assert get_campaign_metrics_paginated(session)["total"] == 2
+    assert get_creative_metrics_paginated(session)["total"] == 2
+    creatives = get_creatives(session)
+    assert len(creatives) == 1
+    assert creatives[0]["serving_hold_reasons"] == "UNDER_REVIEW"
+    assert [d["segment"] for d in get_demographics(session, "job_title")] == ["Engineer", "Designer"]
+
+
+def test_persist_snapshots_last_occurrence_wins(session: Session):
+    persist_snapshots(session, [_make_snapshot(name="Old"), _make_snapshot(name="New")])
+
+    assert [c["name"] for c in get_campaigns(session)] == ["New"]
+
+
+def test_persist_empty_snapshot_issues_no_sql(session: Session):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        persist_snapshot(session, {"accounts": [], "date_range": {}})
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert statements == []
+
+
+def test_reupsert_updates_parent_in_place(session: Session):
+    upsert_account(session, {"id": 100, "name": "Acct", "status": "ACTIVE"})
+    upsert_campaign(session, 100, {"id": 1, "name": "Camp", "status": "ACTIVE", "settings": {}})
+    upsert_creatives(session, 100, {"id": 1, "creatives": [{"id": "cr1", "created_at": 1000}]})
+    upsert_campaign_daily_metrics(session, {"id": 1, "daily_metrics": [{"date": "2026-01-01", "impressions": 10}]})
+    session.commit()
+
+    upsert_account(session, {"id": 100, "name": "Renamed Acct", "status": "ACTIVE"})
+    upsert_campaign(session, 100, {"id": 1, "name": "Renamed", "status": "PAUSED", "settings": {}})
+    upsert_creatives(session, 100, {"id": 1, "creatives": [{"id": "cr1", "created_at": 2000}]})
+    session.commit()
+
+    campaigns = get_campaigns(session)
+    assert [(c["name"], c["status"], c["account_name"]) for c in campaigns] == [("Renamed", "PAUSED", "Renamed Acct")]
+    # Children of the re-upserted campaign survive and created_at is never overwritten
+    assert get_campaign_metrics_paginated(session)["total"] == 1
+    creatives = get_creatives(session)
+    assert [(c["id"], c["created_at"]) for c in creatives] == [("cr1", 1000)]
+
+
 def test_sync_log_lifecycle(session: Session):
     need_sync, reason = should_sync(session, "12345")
     assert need_sync is True
@@ -87,6 +197,32 @@ def test_sync_log_lifecycle(session: Session):
     assert "fresh" in reason
 
 
+def test_stale_sync(session: Session):
+    run_id = start_sync_run(session, "12345")
+    stale_at = int(time.time()) - (settings.FRESHNESS_TTL_MINUTES + 5) * 60
+    finish_sync_run(session, run_id, status="success", now=stale_at)
+
+    need_sync, reason = should_sync(session, "12345")
+    assert need_sync is True
+    assert "ttl=" in reason
+
+
+def test_should_sync_uses_freshness_index(session: Session):
+    plan = session.exec(
+        text(f"EXPLAIN QUERY PLAN {_LAST_SUCCESS_SQL.text}"),
+        params={"now": 0, "ttl_seconds": 0, "account_id": "12345"},
+    ).all()
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_sync_log_freshness" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_active_campaign_audit_uses_partial_index(session: Session):
+    plan = session.exec(text(f"EXPLAIN QUERY PLAN {_ACTIVE_AUDIT_SQL.text}")).all()
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_campaigns_active" in details
+
+
 def test_force_sync(session: Session):
     run_id = start_sync_run(session, "12345")
     finish_sync_run(session, run_id, status="success")
@@ -94,3 +230,46 @@ def test_force_sync(session: Session):
     need_sync, reason = should_sync(session, "12345", force=True)
     assert need_sync is True
     assert "force" in reason
+
+
+def test_snapshot_hash_round_trip(session: Session):
+    snap = {"generated_at": "2026-01-01T00:00:00+00:00", "accounts": [{"id": 1}]}
+    digest = snapshot_digest(snap)
+    # The generation timestamp alone does not change the digest
+    assert snapshot_digest({**snap, "generated_at": "2026-01-02T00:00:00+00:00"}) == digest
+    assert snapshot_digest({**snap, "accounts": [{"id": 2}]}) != digest
+
+    assert last_snapshot_hash(session, "all") is None
+    run_id = start_sync_run(session, "all")
+    finish_sync_run(session, run_id, status="success", stats={"snapshot_hash": digest})
+    assert last_snapshot_hash(session, "all") == digest
+
+
+def test_table_counts(session: Session):
+    upsert_account(session, {"id": 100, "name": "Acct", "status": "ACTIVE"})
+    upsert_campaign(session, 100, {"id": 1, "name": "Camp", "status": "ACTIVE", "settings": {}})
+    upsert_campaign(session, 100, {"id": 2, "name": "Other", "status": "PAUSED", "settings": {}})
+    session.commit()
+
+    assert table_counts(session) == {
+        "ad_accounts": 1, "campaigns": 2, "creatives": 0,
+        "campaign_daily_metrics": 0, "creative_daily_metrics": 0,
+        "audience_demographics": 0,
+    }
+
+
+def test_active_campaign_audit(session: Session):
+    upsert_account(session, {"id": 100, "name": "Acct", "status": "ACTIVE"})
+    upsert_campaign(session, 100, {
+        "id": 1, "name": "Risky", "status": "ACTIVE",
+        "settings": {"cost_type": "CPM", "offsite_delivery_enabled": True},
+    })
+    upsert_campaign(session, 100, {"id": 2, "name": "Clean", "status": "ACTIVE", "settings": {"cost_type": "CPC"}})
+    upsert_campaign(session, 100, {"id": 3, "name": "Paused", "status": "PAUSED", "settings": {"cost_type": "CPM"}})
+    session.commit()
+
+    audit = {entry["name"]: entry["issues"] for entry in active_campaign_audit(session)}
+    assert audit == {
+        "Risky": ["LAN enabled", "Maximum Delivery (CPM)"],
+        "Clean": [],
+    }
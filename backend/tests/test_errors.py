@@ -1,5 +1,7 @@
 """Tests for custom exception hierarchy."""
 
+import pickle
+
 from app.errors.exceptions import (
     AuthenticationError,
     ConfigurationError,
@@ -63,3 +65,12 @@ def test_storage_error():
 def test_data_fetch_error():
     err = DataFetchError("fetch fail", resource_type="campaign", resource_id="123")
     assert err.resource_type == "campaign"
+
+
+def test_errors_pickle_round_trip():
+    err = RateLimitError(retry_after=30, endpoint="/adAccounts")
+    restored = pickle.loads(pickle.dumps(err))
+    assert type(restored) is RateLimitError
+    assert restored.retry_after == 30
+    assert restored.endpoint == "/adAccounts"
+    assert restored.details == err.details
@@ -0,0 +1,110 @@
+"""Tests for the logging utilities."""
+
+import logging
+
+import pytest
+
+from app.utils.logging import (
+    BufferedTimedRotatingFileHandler,
+    get_logger,
+    log_api_call,
+    log_auth_event,
+    log_sync_progress,
+)
+
+
+def _record(level: int, msg: str) -> logging.LogRecord:
+    return logging.LogRecord("app.test", level, __file__, 1, msg, None, None)
+
+
+def test_buffered_handler_defers_writes(tmp_path):
+    path = tmp_path / "app.log"
+    handler = BufferedTimedRotatingFileHandler(path, when="midnight", encoding="utf-8")
+    try:
+        handler.handle(_record(logging.INFO, "first"))
+        assert path.read_text() == ""
+
+        handler.flush_buffer()
+        assert path.read_text() == "first\n"
+    finally:
+        handler.close()
+
+
+def test_buffered_handler_flushes_errors_and_on_close(tmp_path):
+    path = tmp_path / "app.log"
+    handler = BufferedTimedRotatingFileHandler(path, when="midnight", encoding="utf-8")
+    handler.handle(_record(logging.INFO, "info"))
+    handler.handle(_record(logging.ERROR, "boom"))
+    assert path.read_text() == "info\nboom\n"
+
+    handler.handle(_record(logging.INFO, "tail"))
+    handler.close()
+    assert path.read_text() == "info\nboom\ntail\n"
+
+
+@pytest.mark.parametrize(
+    ("fn", "args", "logger_name", "expected"),
+    [
+        (log_api_call, ("GET", "/adCampaigns", 200, 0.5), "app.api.access", "OK GET /adCampaigns -> 200 (0.50s)"),
+        (log_api_call, ("GET", "/adCampaigns", 429, 0.125), "app.api.access", "FAIL GET /adCampaigns -> 429 (0.12s)"),
+        (log_sync_progress, ("2/6", 3, 10), "app.services.sync", "SYNC 2/6 [3/10]"),
+        (log_sync_progress, ("assemble", 1), "app.services.sync", "SYNC assemble [1]"),
+        (log_auth_event, ("Token refreshed",), "app.core.security", "AUTH: Token refreshed"),
+        (log_auth_event, ("Token valid", "Authenticated as: 100%"), "app.core.security",
+         "AUTH: Token valid - Authenticated as: 100%"),
+    ],
+    ids=["api_ok", "api_rate_limited", "sync_total", "sync_count", "auth_event", "auth_details"],
+)
+def test_domain_helpers_format_lazily(caplog, fn, args, logger_name, expected):
+    logger = logging.getLogger(logger_name)
+    # The API access logger does not propagate to the root capture handler.
+    if not logger.propagate:
+        logger.addHandler(caplog.handler)
+    try:
+        with caplog.at_level(logging.INFO, logger=logger_name):
+            fn(*args)
+    finally:
+        logger.removeHandler(caplog.handler)
+    assert [r.getMessage() for r in caplog.records] == [expected]
+
+
+class _FormatSpy:
+    """Argument that counts how often logging renders it."""
+
+    def __init__(self) -> None:
+        self.formatted = 0
+
+    def __str__(self) -> str:
+        self.formatted += 1
+        return "spy"
+
+
+@pytest.mark.parametrize(
+    ("fn", "logger_name"),
+    [
+        (lambda spy: log_api_call("GET", spy, 200, 0.5), "app.api.access"),
+        (lambda spy: log_sync_progress(spy, 3, 10), "app.services.sync"),
+        (lambda spy: log_auth_event("Token valid", spy), "app.core.security"),
+    ],
+    ids=["api", "sync", "auth"],
+)
+def test_domain_helpers_skip_disabled_level(caplog, fn, logger_name):
+    spy = _FormatSpy()
+    with caplog.at_level(logging.WARNING, logger=logger_name):
+        fn(spy)
+    assert caplog.records == []
+    assert spy.formatted == 0
+
+
+def test_log_file_created(tmp_path):
+    log_file = tmp_path / "app.log"
+    handler = BufferedTimedRotatingFileHandler(log_file, when="midnight", encoding="utf-8")
+    app_logger = logging.getLogger("app")
+    app_logger.addHandler(handler)
+    try:
+        get_logger("tests.logging").info("file handler attached")
+        handler.flush_buffer()
+    finally:
+        app_logger.removeHandler(handler)
+        handler.close()
+    assert log_file.read_text(encoding="utf-8") == "file handler attached\n"
@@ -2,6 +2,9 @@
 
 from unittest.mock import patch
 
+import pytest
+
+from app.crud.snapshot import persist_snapshot
 
 
 def test_health_endpoint(client):
@@ -56,6 +59,31 @@ def test_report_campaigns_empty(client):
     assert data["rows"] == []
 
 
+@pytest.mark.parametrize(
+    "path",
+    ["accounts", "campaigns", "campaign-metrics", "creative-metrics", "creatives", "demographics"],
+)
+def test_report_rows_render_fetched_at_as_iso(client, session, path):
+    day = {"date": "2026-01-01", "impressions": 10, "clicks": 1, "spend": 1.0}
+    persist_snapshot(session, {
+        "date_range": {"start": "2026-01-01", "end": "2026-01-01"},
+        "accounts": [{
+            "id": 100, "name": "Acct", "status": "ACTIVE",
+            "campaigns": [{
+                "id": 1, "name": "Camp", "status": "ACTIVE", "settings": {},
+                "daily_metrics": [day],
+                "creatives": [{"id": "cr1", "daily_metrics": [day]}],
+            }],
+            "audience_demographics": {"job_title": [{"segment": "Engineer", "impressions": 10}]},
+        }],
+    }, now=1767225600)
+
+    response = client.get(f"/api/v1/report/{path}")
+    assert response.status_code == 200
+    rows = response.json()["rows"]
+    assert [row["fetched_at"] for row in rows] == ["2026-01-01T00:00:00+00:00"]
+
+
 def test_auth_status(client):
     with patch("app.core.deps.get_auth") as mock:
         mock_auth = mock.return_value
@@ -0,0 +1,207 @@
+"""Tests for snapshot assembly helpers."""
+
+import json
+from datetime import date
+
+from app.models.linkedin_api import LinkedInAccount, LinkedInAnalyticsRow
+from app.services.snapshot import (
+    _aggregate_and_daily,
+    _aggregate_cached,
+    _index_demographics,
+    _pivot_key,
+    _resolve_urn_locally,
+    _top_demographics,
+    _validate_list,
+    assemble_snapshot,
+    save_snapshot_json,
+)
+
+
+def _row(day: int, impressions: int, clicks: int, cost: str | float | None) -> dict:
+    return {
+        "dateRange": {"start": {"year": 2026, "month": 1, "day": day}},
+        "impressions": impressions,
+        "clicks": clicks,
+        "costInLocalCurrency": cost,
+        "externalWebsiteConversions": 1,
+    }
+
+
+def test_aggregate_and_daily():
+    rows = [_row(2, 1000, 10, "12.345"), _row(1, 500, 5, None), _row(2, 500, 0, "2.5")]
+    agg, daily = _aggregate_and_daily(rows)
+
+    assert agg["impressions"] == 2000
+    assert agg["clicks"] == 15
+    assert agg["spend"] == 14.85
+    assert agg["conversions"] == 3
+    assert agg["ctr"] == 0.75
+    assert agg["cpc"] == 0.99
+    assert agg["cpm"] == 7.42
+    assert agg["cpl"] == 4.95
+
+    assert [d["date"] for d in daily] == ["2026-01-01", "2026-01-02"]
+    assert daily[0]["spend"] == 0.0
+    assert daily[0]["cpc"] == 0
+    assert daily[1]["impressions"] == 1500
+    assert daily[1]["spend"] == 14.85
+    assert daily[1]["ctr"] == 0.6667
+
+
+def test_aggregate_and_daily_empty():
+    agg, daily = _aggregate_and_daily([])
+    assert agg["impressions"] == 0
+    assert agg["ctr"] == 0
+    assert daily == []
+
+
+def test_aggregate_and_daily_complete_and_sparse_rows_agree():
+    complete = {
+        "dateRange": {"start": {"year": 2026, "month": 1, "day": 1}},
+        "impressions": 100, "clicks": 4, "landingPageClicks": 3,
+        "externalWebsiteConversions": 0, "likes": 2, "comments": 0, "shares": 0,
+        "follows": 0, "oneClickLeads": 1, "opens": 0, "sends": 0,
+        "costInLocalCurrency": "1.5",
+    }
+    sparse = {k: v for k, v in complete.items() if v != 0}
+    assert _aggregate_and_daily([complete]) == _aggregate_and_daily([sparse])
+
+
+def test_native_float_cost_matches_string_cost():
+    # LinkedIn sends costInLocalCurrency as a string; numeric JSON takes the
+    # same path without a parse step.
+    assert LinkedInAnalyticsRow.model_validate({"costInLocalCurrency": 123.45}).cost_in_local_currency == 123.45
+    assert LinkedInAnalyticsRow.model_validate({"costInLocalCurrency": "123.45"}).cost_in_local_currency == 123.45
+
+    as_str = [_row(1, 1000, 10, "12.345"), _row(2, 500, 0, "2.5")]
+    as_float = [_row(1, 1000, 10, 12.345), _row(2, 500, 0, 2.5)]
+    assert _aggregate_and_daily(as_float) == _aggregate_and_daily(as_str)
+
+
+def test_aggregate_cached_reuses_result_per_list():
+    rows = [_row(1, 100, 1, "1.0")]
+    cache: dict = {}
+    first = _aggregate_cached(rows, cache)
+    assert _aggregate_cached(rows, cache) is first
+    assert _aggregate_cached(list(rows), cache) is not first
+    assert first == _aggregate_and_daily(rows)
+
+
+def test_index_demographics_formats():
+    pivots = {"MEMBER_SENIORITY": [{"pivotValues": ["urn:li:seniority:3"], "impressions": 5}]}
+    by_account, shared = _index_demographics({
+        1: {"pivots": pivots, "urn_names": {"urn:li:title:1": "Engineer"}},
+        2: pivots,
+        3: ["not", "a", "dict"],
+    })
+    assert by_account[1] == (pivots, {"urn:li:title:1": "Engineer"})
+    assert by_account[2] == (pivots, {})
+    assert by_account[3] == (None, {})
+
+    # Legacy single-account payload: every account falls back to it
+    by_account, shared = _index_demographics(pivots)
+    assert shared is pivots
+
+    assert _index_demographics(None) == ({}, None)
+
+
+def test_pivot_key():
+    assert _pivot_key("MEMBER_SENIORITY") == "seniority"
+    assert _pivot_key("MEMBER_JOB_TITLE") == "job_title"
+    assert _pivot_key("company_size") == "company_size"
+
+
+def test_resolve_urn_locally():
+    assert _resolve_urn_locally("urn:li:seniority:1") == "Unpaid"
+    assert _resolve_urn_locally("urn:li:companySize:B") == "2-10 employees"
+    assert _resolve_urn_locally("urn:li:companySizeRange:I") == "10,001+ employees"
+    assert _resolve_urn_locally("urn:li:function:26") == "Customer Success & Support"
+    assert _resolve_urn_locally("urn:li:geo:103644278") == ""
+    assert _resolve_urn_locally("seniority") == ""
+
+
+def test_top_demographics_orders_and_truncates():
+    rows = [
+        {"pivotValues": ["urn:li:seniority:3"], "impressions": 50, "clicks": 5},
+        {"pivotValues": ["urn:li:title:1"], "impressions": 200, "clicks": 4},
+        {"pivotValues": ["urn:li:seniority:4"], "impressions": 50, "clicks": 0},
+        {"pivotValues": ["urn:li:title:2"], "impressions": 700, "clicks": 7},
+    ]
+    top = _top_demographics(rows, urn_names={"urn:li:title:2": "Engineer"}, top_n=3)
+
+    # Ties keep input order, exactly like a stable descending sort
+    assert [t["segment"] for t in top] == ["Engineer", "urn:li:title:1", "Entry"]
+    assert top[0]["share_of_impressions"] == 70.0
+    assert top[0]["ctr"] == 1.0
+
+
+def test_validate_list_drops_only_invalid_items():
+    raw = [{"id": i, "name": f"A{i}", "status": "ACTIVE"} for i in range(600)]
+    raw[3] = {"id": 3}
+    raw[400] = {"id": "not-an-int", "name": "x", "status": "ACTIVE"}
+
+    valid = _validate_list(raw, LinkedInAccount, "account")
+
+    assert len(valid) == 598
+    assert [r["id"] for r in valid] == [i for i in range(600) if i not in (3, 400)]
+    assert valid[0] is raw[0]
+
+
+def test_assemble_snapshot_prevalidated_inputs():
+    accounts = [{"id": 1, "name": "Acct", "status": "ACTIVE"}]
+    campaigns = [{"id": 10, "name": "Camp", "status": "ACTIVE", "_account_id": 1}]
+    metrics = [{
+        "pivotValues": ["urn:li:sponsoredCampaign:10"],
+        "dateRange": {"start": {"year": 2026, "month": 1, "day": 1}},
+        "impressions": 100, "clicks": 2, "costInLocalCurrency": "3.5",
+    }]
+    args = (accounts, campaigns, [], metrics, [], {}, date(2026, 1, 1), date(2026, 1, 31))
+
+    checked = assemble_snapshot(*args)
+    trusted = assemble_snapshot(*args, validated=True)
+    checked.pop("generated_at")
+    trusted.pop("generated_at")
+    assert trusted == checked
+    assert checked["accounts"][0]["campaigns"][0]["metrics_summary"]["spend"] == 3.5
+
+
+def test_assemble_snapshot_untagged_campaigns_shared():
+    accounts = [{"id": 1, "name": "A", "status": "ACTIVE"}, {"id": 2, "name": "B", "status": "ACTIVE"}]
+    campaigns = [{"id": 10, "name": "Camp", "status": "ACTIVE"}, {"id": 11, "name": "Other", "status": "PAUSED"}]
+    snap = assemble_snapshot(accounts, campaigns, [], [], [], {}, date(2026, 1, 1), date(2026, 1, 31))
+
+    first, second = (a["campaigns"] for a in snap["accounts"])
+    assert [c["id"] for c in first] == [10, 11]
+    assert first == second
+    assert first[0] is not second[0]
+
+
+def test_assemble_snapshot_buckets_coercible_account_tags():
+    accounts = [{"id": 2, "name": "A", "status": "ACTIVE"}, {"id": 3, "name": "B", "status": "ACTIVE"}]
+    campaigns = [
+        {"id": 10, "name": "Float", "status": "ACTIVE", "_account_id": 2.0},
+        {"id": 11, "name": "Padded", "status": "ACTIVE", "_account_id": " 3"},
+        {"id": 12, "name": "Signed", "status": "ACTIVE", "_account_id": "+3"},
+        {"id": 13, "name": "Junk", "status": "ACTIVE", "_account_id": "n/a"},
+    ]
+    snap = assemble_snapshot(accounts, campaigns, [], [], [], {}, date(2026, 1, 1), date(2026, 1, 31))
+
+    assert [[c["id"] for c in a["campaigns"]] for a in snap["accounts"]] == [[10], [11, 12]]
+
+
+def test_save_snapshot_json(tmp_path):
+    snap = {"date_range": {"start": date(2026, 1, 1)}, "accounts": [{"id": 1, "name": "Acct"}]}
+    path = save_snapshot_json(snap, tmp_path / "nested" / "snapshot.json")
+    assert json.loads(path.read_text(encoding="utf-8")) == {
+        "date_range": {"start": "2026-01-01"},
+        "accounts": [{"id": 1, "name": "Acct"}],
+    }
+
+
+def test_save_snapshot_json_pretty(tmp_path):
+    snap = {"accounts": [{"id": 1}]}
+    compact = save_snapshot_json(snap, tmp_path / "compact.json").read_text(encoding="utf-8")
+    pretty = save_snapshot_json(snap, tmp_path / "pretty.json", pretty=True).read_text(encoding="utf-8")
+    assert compact == '{"accounts":[{"id":1}]}'
+    assert json.loads(pretty) == snap
+    assert "\n  " in pretty